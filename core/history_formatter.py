@@ -0,0 +1,29 @@
+# core/history_formatter.py
+from typing import Dict, List, Optional, Tuple
+
+
+class HistoryFormatter:
+    """
+    Formats chat history as 'role: content' lines. The chat history only grows,
+    so the previously formatted prefix is reused and just the new tail is formatted.
+    """
+
+    def __init__(self):
+        # (history list id, formatted length, last formatted message, formatted text)
+        self._cache: Tuple[int, int, Optional[Dict], str] = (0, 0, None, "")
+
+    def format(self, conversation_history: List[Dict]) -> str:
+        cached_id, cached_len, cached_last, cached_str = self._cache
+        history_len = len(conversation_history)
+        if (cached_id == id(conversation_history) and 0 < cached_len <= history_len
+                and conversation_history[cached_len - 1] is cached_last):
+            if cached_len == history_len:
+                return cached_str
+            tail = "\n".join(f"{msg['role']}: {msg['content']}" for msg in conversation_history[cached_len:])
+            formatted = f"{cached_str}\n{tail}"
+        else:
+            formatted = "\n".join(f"{msg['role']}: {msg['content']}" for msg in conversation_history)
+
+        last_msg = conversation_history[-1] if conversation_history else None
+        self._cache = (id(conversation_history), history_len, last_msg, formatted)
+        return formatted
@@ -0,0 +1,43 @@
+# core/json_utils.py
+"""
+JSON helpers that use orjson when it is installed and fall back to the
+standard library otherwise. orjson.JSONDecodeError subclasses
+json.JSONDecodeError, so callers catch the same exception either way.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parses a JSON document from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False, sort_keys: bool = False,
+          default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serializes obj to UTF-8 JSON bytes, optionally indented by two spaces.
+    default converts otherwise unserializable values, as in json.dumps.
+    """
+    if ORJSON_AVAILABLE:
+        # Non-string dict keys are stringified, matching the stdlib
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys, default=default, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), sort_keys=sort_keys, default=default,
+                      ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,143 @@
+# core/llm_cache.py
+"""
+Caches complete LLM responses so repeated prompts skip the model round-trip.
+Prompts are keyed by role, provider, model, sampling temperature and a hash of
+the exact prompt text; prompts often embed source code, where whitespace matters.
+Entries can optionally be persisted to SQLite so the cache survives restarts.
+"""
+import hashlib
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str, float, str]
+
+DEFAULT_TTL_SECONDS = 60 * 60
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_PERSISTED_ENTRIES = 2048
+# Responses carrying these markers are transport failures, never real answers.
+UNCACHEABLE_PREFIXES = ("LLM_API_ERROR",)
+
+_SCHEMA = (
+    # The first table keyed whitespace-collapsed prompts without temperature, so its rows are unsafe to reuse
+    "DROP TABLE IF EXISTS llm_cache",
+    "CREATE TABLE IF NOT EXISTS llm_cache_v2 ("
+    "role TEXT NOT NULL, provider TEXT NOT NULL, model TEXT NOT NULL, temperature REAL NOT NULL, "
+    "prompt_sha256 TEXT NOT NULL, response TEXT NOT NULL, created_at REAL NOT NULL, "
+    "PRIMARY KEY (role, provider, model, temperature, prompt_sha256))",
+    "CREATE INDEX IF NOT EXISTS llm_cache_v2_created_at ON llm_cache_v2 (created_at)",
+)
+
+
+class LLMResponseCache:
+    """
+    Response cache with a per-entry time-to-live. Lookups hit an in-memory LRU first;
+    when a db_path is given, misses fall through to an SQLite table that outlives the process.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 db_path: Optional[Path] = None, max_persisted_entries: int = DEFAULT_MAX_PERSISTED_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_persisted_entries = max_persisted_entries
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self._db = self._open_db(db_path) if db_path else None
+
+    def _open_db(self, db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db = sqlite3.connect(str(db_path))
+            for statement in _SCHEMA:
+                db.execute(statement)
+            db.execute("DELETE FROM llm_cache_v2 WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+            db.commit()
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"[LLMResponseCache] Persistent cache at {db_path} unavailable, using memory only: {e}")
+            return None
+
+    @staticmethod
+    def make_key(role: str, provider: str, model: str, temperature: float, prompt: str) -> CacheKey:
+        """Builds a cache key; roles are kept apart so their outputs never mix."""
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return role or "", provider, model, float(temperature), digest
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load_persisted(key)
+            if entry is None:
+                return None
+            self._remember(key, entry)
+        stored_at, response = entry
+        if time.time() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: CacheKey, response: str) -> None:
+        if not response or response.isspace() or response.startswith(UNCACHEABLE_PREFIXES):
+            return
+        entry = (time.time(), response)
+        self._remember(key, entry)
+        self._persist(key, entry)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self._db is not None:
+            try:
+                self._db.execute("DELETE FROM llm_cache_v2")
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"[LLMResponseCache] Could not clear persistent cache: {e}")
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: CacheKey, entry: Tuple[float, str]) -> None:
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.max_entries:
+            # Hits move entries to the end, so the first one is the least recently used
+            self._entries.popitem(last=False)
+        self._entries[key] = entry
+
+    def _load_persisted(self, key: CacheKey) -> Optional[Tuple[float, str]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT created_at, response FROM llm_cache_v2 "
+                "WHERE role = ? AND provider = ? AND model = ? AND temperature = ? AND prompt_sha256 = ?",
+                key,
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"[LLMResponseCache] Persistent cache lookup failed: {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def _persist(self, key: CacheKey, entry: Tuple[float, str]) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache_v2 "
+                "(role, provider, model, temperature, prompt_sha256, created_at, response) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, *entry),
+            )
+            # Keep only the newest rows once the table outgrows its budget
+            self._db.execute(
+                "DELETE FROM llm_cache_v2 WHERE rowid IN "
+                "(SELECT rowid FROM llm_cache_v2 ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_persisted_entries,),
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"[LLMResponseCache] Could not persist cache entry: {e}")
@@ -1,14 +1,21 @@
 # core/llm_client.py
+import asyncio
 import os
 import json
 import base64
 import logging
-from typing import Dict, Optional, Any, List
+from types import MappingProxyType
+from typing import Dict, Optional, Any, List, Mapping
 import aiohttp
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Pool settings for the HTTP session shared by all requests to the LLM server.
+POOL_CONNECTION_LIMIT = 64
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 60
+
 
 class LLMClient:
     """
@@ -25,6 +32,12 @@ class LLMClient:
         self.default_assignments_file = self.config_dir / "default_role_assignments.json"
         self.role_assignments = {}
         self.role_temperatures = {}
+        # Bumped whenever assignments or temperatures change, so callers can cache per version.
+        self.assignments_version = 0
+        self._model_for_role_cache: Dict[str, tuple] = {}
+        self._model_for_role_cache_version = -1
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         self.load_assignments()
         logger.info(f"[LLMClient] Client initialized. Will connect to LLM server at {self.llm_server_url}")
 
@@ -77,6 +90,7 @@ class LLMClient:
 
         self.role_assignments = final_assignments
         self.role_temperatures = final_temperatures
+        self.assignments_version += 1
 
         # Step 5: Save the potentially repaired config back to the user's file.
         self.save_assignments()
@@ -90,40 +104,79 @@ class LLMClient:
         with open(self.assignments_file, 'w') as f:
             json.dump(config_data, f, indent=4)
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled HTTP session so connections to the LLM server are kept
+        alive between calls. A new one is made if it was closed or belongs to another loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_CONNECTION_LIMIT,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Closes the pooled HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def get_available_models(self) -> dict:
         """Fetches the list of available models from the LLM server."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.llm_server_url}/get_available_models", timeout=5) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.error(f"[LLMClient] Error getting models from server: {response.status}")
-                        return {}
+            session = self._get_session()
+            async with session.get(f"{self.llm_server_url}/get_available_models", timeout=5) as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    logger.error(f"[LLMClient] Error getting models from server: {response.status}")
+                    return {}
         except Exception as e:
             logger.error(f"[LLMClient] Could not connect to LLM server to get models: {e}")
             return {}
 
-    def get_role_assignments(self) -> dict:
-        return self.role_assignments.copy()
+    def get_role_assignments(self) -> Mapping[str, str]:
+        """Returns a read-only live view of the role assignments."""
+        return MappingProxyType(self.role_assignments)
 
     def set_role_assignments(self, assignments: dict):
         self.role_assignments.update(assignments)
+        self.assignments_version += 1
 
-    def get_role_temperatures(self) -> dict:
-        return self.role_temperatures.copy()
+    def get_role_temperatures(self) -> Mapping[str, float]:
+        """Returns a read-only live view of the role temperatures."""
+        return MappingProxyType(self.role_temperatures)
 
     def set_role_temperatures(self, temperatures: dict):
         self.role_temperatures.update(temperatures)
+        self.assignments_version += 1
 
     def get_role_temperature(self, role: str) -> float:
         return self.role_temperatures.get(role, 0.7)
 
     def get_model_for_role(self, role: str) -> tuple[str | None, str | None]:
+        """Resolves a role to (provider, model), cached until the assignments change."""
+        if self._model_for_role_cache_version != self.assignments_version:
+            self._model_for_role_cache.clear()
+            self._model_for_role_cache_version = self.assignments_version
+        cached = self._model_for_role_cache.get(role)
+        if cached is not None:
+            return cached
+
         key = self.role_assignments.get(role, self.role_assignments.get("chat"))
-        if not key or "/" not in key: return None, None
-        provider, model_name = key.split('/', 1)
-        return provider, model_name
+        if not key or "/" not in key:
+            resolved = (None, None)
+        else:
+            provider, model_name = key.split('/', 1)
+            resolved = (provider, model_name)
+        self._model_for_role_cache[role] = resolved
+        return resolved
 
     async def stream_chat(self, provider: str, model: str, prompt: str, role: str = None,
                           image_bytes: Optional[bytes] = None, image_media_type: str = "image/png",
@@ -142,39 +195,46 @@ class LLMClient:
             "history": history or []
         }
 
-        logger.info(f"[LLMClient] Starting stream chat for role '{role}' using {provider}/{model}")
-        logger.debug(f"[LLMClient] Prompt length: {len(prompt)} characters")
-        logger.debug(f"[LLMClient] Temperature: {temperature}")
+        logger.info("[LLMClient] Starting stream chat for role '%s' using %s/%s", role, provider, model)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("[LLMClient] Prompt length: %d characters", len(prompt))
+            logger.debug("[LLMClient] Temperature: %s", temperature)
 
         chunk_count = 0
-        total_response = ""
+        response_length = 0
+        response_preview = ""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{self.llm_server_url}/stream_chat", json=payload, timeout=300) as response:
-                    if response.status == 200:
-                        logger.info(f"[LLMClient] Successfully connected to LLM server")
-                        async for line in response.content:
-                            if line:
-                                chunk = line.decode('utf-8')
-                                chunk_count += 1
-                                total_response += chunk
-
+            session = self._get_session()
+            async with session.post(f"{self.llm_server_url}/stream_chat", json=payload, timeout=300) as response:
+                if response.status == 200:
+                    logger.info("[LLMClient] Successfully connected to LLM server")
+                    async for line in response.content:
+                        if line:
+                            chunk = line.decode('utf-8')
+                            chunk_count += 1
+                            response_length += len(chunk)
+
+                            if debug_enabled:
+                                if len(response_preview) < 200:
+                                    response_preview += chunk
                                 # Log first few chunks and every 10th chunk for debugging
                                 if chunk_count <= 3 or chunk_count % 10 == 0:
-                                    logger.debug(f"[LLMClient] Chunk {chunk_count}: {chunk[:100]}...")
+                                    logger.debug("[LLMClient] Chunk %d: %s...", chunk_count, chunk[:100])
 
-                                yield chunk
+                            yield chunk
 
-                        logger.info(
-                            f"[LLMClient] Stream completed. Total chunks: {chunk_count}, Response length: {len(total_response)}")
-                        logger.debug(f"[LLMClient] Complete response preview: {total_response[:200]}...")
+                    logger.info("[LLMClient] Stream completed. Total chunks: %d, Response length: %d",
+                                chunk_count, response_length)
+                    if debug_enabled:
+                        logger.debug("[LLMClient] Complete response preview: %s...", response_preview[:200])
 
-                    else:
-                        error_text = await response.text()
-                        error_msg = f"LLM_API_ERROR: Failed to stream from server. Status: {response.status}, Details: {error_text}"
-                        logger.error(f"[LLMClient] {error_msg}")
-                        yield error_msg
+                else:
+                    error_text = await response.text()
+                    error_msg = f"LLM_API_ERROR: Failed to stream from server. Status: {response.status}, Details: {error_text}"
+                    logger.error(f"[LLMClient] {error_msg}")
+                    yield error_msg
         except Exception as e:
             error_msg = f"LLM_API_ERROR: Could not connect to LLM server. Is it running? Details: {e}"
             logger.error(f"[LLMClient] {error_msg}")
@@ -1,8 +1,11 @@
 # core/managers/project_manager.py
+import os
 import shutil
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator, Set, Tuple
 
 from .git_manager import GitManager
 from .venv_manager import VenvManager
@@ -10,6 +13,61 @@ from .project_context import ProjectContext
 from event_bus import EventBus
 from events import ProjectCreated
 
+IGNORED_PROJECT_DIRS = {'.git', '.venv', 'venv', '__pycache__', 'node_modules', 'dist', 'build', 'rag_db'}
+ALLOWED_PROJECT_FILE_EXTENSIONS = {
+    '.py', '.md', '.txt', '.json', '.toml', '.ini', '.cfg', '.yaml', '.yml',
+    '.html', '.css', '.js', '.ts'
+}
+COMMON_PROJECT_FILENAMES = {'Dockerfile', '.gitignore', '.env'}
+MAX_PROJECT_FILE_BYTES = 1024 * 1024
+FILE_READ_WORKERS = 8
+# Bounds on the retained file-content cache; files beyond these are simply re-read next time.
+FILE_CACHE_MAX_ITEMS = 2000
+FILE_CACHE_MAX_CHARS = 32 * 1024 * 1024
+
+
+def _iter_project_files(root: str, skip: Set[str]) -> Iterator[os.DirEntry]:
+    """
+    Walks the directory tree with an explicit stack of directories, yielding
+    file entries. Pruned directories are never descended into.
+    """
+    pending_dirs = deque([root])
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip:
+                            pending_dirs.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+
+
+def _iter_project_text_files(root: str) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """Yields project text files within the size limit, with their stat results."""
+    for entry in _iter_project_files(root, IGNORED_PROJECT_DIRS):
+        name = entry.name
+        if os.path.splitext(name)[1].lower() not in ALLOWED_PROJECT_FILE_EXTENSIONS and name not in COMMON_PROJECT_FILENAMES:
+            continue
+        try:
+            stat_result = entry.stat()
+        except OSError:
+            continue
+        if stat_result.st_size <= MAX_PROJECT_FILE_BYTES:
+            yield entry, stat_result
+
+
+def _read_text_file(path: str) -> Optional[str]:
+    """Reads a text file, returning None if it cannot be read."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    except Exception:
+        return None
+
 
 class ProjectManager:
     """
@@ -25,11 +83,21 @@ class ProjectManager:
         self.git_manager: Optional[GitManager] = None
         self.venv_manager: Optional[VenvManager] = None
         self.is_existing_project: bool = False
+        self._file_content_cache: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        # Bumped whenever the project's files may have changed; cached views compare against it.
+        self.files_version = 0
+        self._file_structure_cache: Tuple[int, str] = (-1, "")
+        self.event_bus.subscribe("refresh_file_tree", self.mark_files_changed)
+
+    def mark_files_changed(self, _event=None):
+        """Invalidates cached views of the project's file list."""
+        self.files_version += 1
 
     def clear_active_project(self):
         """Resets the active project context."""
         print("[ProjectManager] Clearing active project.")
         self.active_project_path = None
+        self.mark_files_changed()
         self.git_manager = None
         self.venv_manager = None
         self.is_existing_project = False
@@ -79,6 +147,7 @@ class ProjectManager:
         print(f"[ProjectManager] Creating new project at: {project_path}")
 
         self.active_project_path = project_path
+        self.mark_files_changed()
         self.is_existing_project = False
         self.git_manager = GitManager(project_path)
         self.venv_manager = VenvManager(project_path)
@@ -110,6 +179,7 @@ class ProjectManager:
 
         print(f"[ProjectManager] Loading project from: {project_path}")
         self.active_project_path = project_path
+        self.mark_files_changed()
         self.is_existing_project = True
         self.git_manager = GitManager(project_path)
         self.venv_manager = VenvManager(project_path)
@@ -130,25 +200,63 @@ class ProjectManager:
         return str(self.active_project_path)
 
     def get_project_files(self) -> dict[str, str]:
-        """Reads all relevant text files from the project directory."""
+        """
+        Reads all relevant text files from the project directory. File contents
+        are cached by modification time, so unchanged files are not re-read.
+        """
         if not self.active_project_path: return {}
-        project_files = {}
-        ignore_dirs = {'.git', '.venv', 'venv', '__pycache__', 'node_modules', 'dist', 'build', 'rag_db'}
-        allowed_extensions = {
-            '.py', '.md', '.txt', '.json', '.toml', '.ini', '.cfg', '.yaml', '.yml',
-            '.html', '.css', '.js', '.ts'
+        root = str(self.active_project_path)
+        previous_cache = self._file_content_cache
+        current_cache: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        stale_paths: List[Tuple[str, int]] = []
+
+        for entry, stat_result in _iter_project_text_files(root):
+            cached = previous_cache.get(entry.path)
+            if cached is not None and cached[0] == stat_result.st_mtime_ns:
+                current_cache[entry.path] = cached
+            else:
+                stale_paths.append((entry.path, stat_result.st_mtime_ns))
+
+        if stale_paths:
+            with ThreadPoolExecutor(max_workers=min(FILE_READ_WORKERS, len(stale_paths))) as executor:
+                contents = executor.map(_read_text_file, [path for path, _ in stale_paths])
+                for (path, mtime_ns), content in zip(stale_paths, contents):
+                    if content is not None:
+                        current_cache[path] = (mtime_ns, content)
+
+        files = {
+            os.path.relpath(path, root).replace(os.sep, '/'): content
+            for path, (_, content) in current_cache.items()
         }
-        common_filenames = {'Dockerfile', '.gitignore', '.env'}
-
-        for item in self.active_project_path.rglob('*'):
-            if any(part in ignore_dirs for part in item.relative_to(self.active_project_path).parts):
-                continue
-            if item.is_file() and (item.suffix.lower() in allowed_extensions or item.name in common_filenames):
-                try:
-                    project_files[item.relative_to(self.active_project_path).as_posix()] = item.read_text(encoding='utf-8', errors='ignore')
-                except Exception:
-                    pass
-        return project_files
+        self._retain_file_cache(current_cache)
+        return files
+
+    def iter_project_file_paths(self) -> Iterator[str]:
+        """Yields the relative paths of the project's text files without reading their contents."""
+        if not self.active_project_path: return
+        root = str(self.active_project_path)
+        for entry, _ in _iter_project_text_files(root):
+            yield os.path.relpath(entry.path, root).replace(os.sep, '/')
+
+    def get_file_structure(self) -> str:
+        """Returns the sorted project file paths, one per line, re-listed only after a file change."""
+        version, structure = self._file_structure_cache
+        if version != self.files_version:
+            structure = "\n".join(sorted(self.iter_project_file_paths()))
+            self._file_structure_cache = (self.files_version, structure)
+        return structure
+
+    def _retain_file_cache(self, cache: "OrderedDict[str, Tuple[int, str]]"):
+        """Keeps the file cache for the next call, evicting the oldest entries past the item/size caps."""
+        total_chars = sum(len(content) for _, content in cache.values())
+        evicted = 0
+        while cache and (len(cache) > FILE_CACHE_MAX_ITEMS or total_chars > FILE_CACHE_MAX_CHARS):
+            _, (_, content) = cache.popitem(last=False)
+            total_chars -= len(content)
+            evicted += 1
+        if evicted:
+            print(f"[ProjectManager] File cache full; evicted {evicted} entries.")
+        self._file_content_cache = cache
 
     def read_file(self, relative_path: str) -> Optional[str]:
         if not self.active_project_path: return None
@@ -163,6 +271,7 @@ class ProjectManager:
         if self.git_manager:
             self.git_manager.write_and_stage_files(files)
             self.git_manager.commit_staged_files(commit_message)
+            self.mark_files_changed()
 
     def get_git_diff(self) -> str:
         return self.git_manager.get_diff() if self.git_manager else "Git not available."
@@ -172,21 +281,25 @@ class ProjectManager:
 
     def rename_item(self, relative_item_path_str: str, new_name_str: str) -> tuple[bool, str, Optional[str]]:
         if self.git_manager:
+            self.mark_files_changed()
             return self.git_manager.rename_item(relative_item_path_str, new_name_str)
         return False, "Git not available.", None
 
     def delete_items(self, relative_item_paths: List[str]) -> tuple[bool, str]:
         if self.git_manager:
+            self.mark_files_changed()
             return self.git_manager.delete_items(relative_item_paths)
         return False, "Git not available."
 
     def create_file(self, relative_parent_dir_str: str, new_filename_str: str) -> tuple[bool, str, Optional[str]]:
         if self.git_manager:
+            self.mark_files_changed()
             return self.git_manager.create_file(relative_parent_dir_str, new_filename_str)
         return False, "Git not available.", None
 
     def create_folder(self, relative_parent_dir_str: str, new_folder_name_str: str) -> tuple[bool, str, Optional[str]]:
         if self.git_manager:
+            self.mark_files_changed()
             return self.git_manager.create_folder(relative_parent_dir_str, new_folder_name_str)
         return False, "Git not available.", None
 
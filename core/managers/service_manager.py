@@ -3,13 +3,14 @@ from __future__ import annotations
 import sys
 import subprocess
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 import traceback
 import asyncio
 
 from event_bus import EventBus
 from core.managers.config_manager import ConfigManager
 from core.llm_client import LLMClient
+from core.llm_cache import LLMResponseCache
 from core.managers.project_manager import ProjectManager
 from core.execution_engine import ExecutionEngine
 from services import (
@@ -22,6 +23,9 @@ from events import ProjectCreated
 if TYPE_CHECKING:
     from core.managers.window_manager import WindowManager
 
+RESPONSE_CACHE_FILENAME = "llm_response_cache.sqlite3"
+PERSISTENT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
 
 class ServiceManager:
     """
@@ -34,6 +38,7 @@ class ServiceManager:
         self.project_root = project_root
         self.config_manager = ConfigManager(project_root)
         self.llm_client: LLMClient = None
+        self.llm_response_cache: Optional[LLMResponseCache] = None
         self.project_manager: ProjectManager = None
         self.execution_engine: ExecutionEngine = None
         self.foundry_manager: FoundryManager = None
@@ -49,9 +54,22 @@ class ServiceManager:
 
         self.llm_server_process: Optional[subprocess.Popen] = None
         self.event_bus.subscribe("project_created", self._on_project_activated)
+        # Subscribed here rather than by MissionLogService: a new log service is created on every
+        # project activation and the bus cannot unsubscribe, so only the current one may receive batches.
+        self.event_bus.subscribe("add_mission_tasks_batch", self._on_add_mission_tasks_batch)
 
         self.log_to_event_bus("info", "[ServiceManager] Initialized")
 
+    def _on_add_mission_tasks_batch(self, descriptions: List[str]):
+        """Forwards a planned batch of task descriptions to the current mission log."""
+        if not self.mission_log_service:
+            self.log_to_event_bus("warning", "No mission log is active; dropping the planned tasks.")
+            return
+        try:
+            self.mission_log_service.add_tasks((description, None) for description in descriptions)
+        except ValueError as e:
+            self.log_to_event_bus("error", f"Rejected planned tasks: {e}")
+
     def _on_project_activated(self, event: ProjectCreated):
         """
         Initializes or re-initializes services that depend on an active project.
@@ -206,12 +224,25 @@ class ServiceManager:
 
     async def shutdown(self):
         self.log_to_event_bus("info", "[ServiceManager] Shutting down services...")
+        if self.llm_client:
+            await self.llm_client.close()
+        if self.llm_response_cache:
+            self.llm_response_cache.close()
         self.terminate_background_servers()
         self.log_to_event_bus("info", "[ServiceManager] Services shutdown complete")
 
     def get_llm_client(self) -> LLMClient:
         return self.llm_client
 
+    def get_llm_response_cache(self) -> LLMResponseCache:
+        """Shared LLM response cache, opened on first use rather than at startup."""
+        if self.llm_response_cache is None:
+            self.llm_response_cache = LLMResponseCache(
+                ttl_seconds=PERSISTENT_CACHE_TTL_SECONDS,
+                db_path=self.llm_client.config_dir / RESPONSE_CACHE_FILENAME
+            )
+        return self.llm_response_cache
+
     def get_project_manager(self) -> ProjectManager:
         return self.project_manager
 
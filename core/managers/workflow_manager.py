@@ -32,7 +32,7 @@ class WorkflowManager:
         It passes the request to the DevelopmentTeamService's intelligent dispatcher.
         """
         prompt = event.prompt_text
-        if not prompt.strip() and not event.image_bytes:
+        if (not prompt or prompt.isspace()) and not event.image_bytes:
             return
 
         dev_team_service = self.service_manager.get_development_team_service()
@@ -28,17 +28,20 @@ class ArchitectPrompt:
     {MasterRules.JSON_OUTPUT_RULE}
     """
 
-    def render(self, user_idea: str, conversation_history: str) -> str:
-        """Assembles the final prompt string to be sent to the LLM."""
-        return f"""
-        {self._persona}
+    # Everything ahead of the per-request fields, rendered once when the class is defined
+    _static_prefix = f"""
+        {_persona}
 
-        {self._directives}
+        {_directives}
 
-        {self._output_format}
+        {_output_format}
 
         **CONTEXT: CONVERSATION HISTORY**
-        {conversation_history}
+        """
+
+    def render(self, user_idea: str, conversation_history: str) -> str:
+        """Assembles the final prompt string to be sent to the LLM."""
+        return self._static_prefix + f"""{conversation_history}
 
         **USER'S REQUEST:**
         "{user_idea}"
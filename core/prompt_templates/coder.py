@@ -1,4 +1,6 @@
 # aura/core/prompt_templates/coder.py
+from typing import Optional, Tuple
+
 from .rules import MasterRules
 
 
@@ -27,16 +29,39 @@ class CoderPrompt:
     4.  **Formulate Arguments:** Construct the exact arguments needed for the selected tool. Ensure all paths and names are correct.
     """
 
-    def render(self, current_task: str, mission_log: str, available_tools: str, file_structure: str,
-               relevant_code_snippets: str) -> str:
-        """Assembles the final prompt string to be sent to the LLM."""
-        return f"""
+    # (tool listing, prefix rendered for it); the listing only changes with the toolbox
+    _prefix_cache: Tuple[Optional[str], str] = (None, "")
+
+    def render_static_prefix(self, available_tools: str) -> str:
+        """Renders the part of the prompt that only changes when the toolbox does."""
+        cached_tools, prefix = self._prefix_cache
+        if cached_tools == available_tools:
+            return prefix
+        prefix = f"""
         {self._persona}
 
         {self._directives}
 
         {self._reasoning_structure}
 
+        **AVAILABLE TOOLS:** Your complete toolbox.
+            ```json
+            {available_tools}
+            ```
+
+        **YOUR OUTPUT:**
+        {MasterRules.JSON_OUTPUT_RULE}
+        """
+        self._prefix_cache = (available_tools, prefix)
+        return prefix
+
+    def render(self, current_task: str, mission_log: str, available_tools: str, file_structure: str,
+               relevant_code_snippets: str) -> str:
+        """
+        Assembles the final prompt string to be sent to the LLM. The static
+        instructions come first so every call shares a byte-identical prefix.
+        """
+        return self.render_static_prefix(available_tools) + f"""
         **CONTEXT BUNDLE:**
 
         1.  **CURRENT TASK:** Your immediate objective.
@@ -47,21 +72,15 @@ class CoderPrompt:
             {mission_log}
             ```
 
-        3.  **AVAILABLE TOOLS:** Your complete toolbox.
-            ```json
-            {available_tools}
-            ```
-
-        4.  **PROJECT FILE STRUCTURE:** A list of all files currently in the project.
+        3.  **PROJECT FILE STRUCTURE:** A list of all files currently in the project.
             ```
             {file_structure}
             ```
 
-        5.  **RELEVANT CODE SNIPPETS:** Relevant existing code snippets.
+        4.  **RELEVANT CODE SNIPPETS:** Relevant existing code snippets.
             ```
             {relevant_code_snippets}
             ```
 
-        **YOUR OUTPUT:**
-        {MasterRules.JSON_OUTPUT_RULE}
-        """
\ No newline at end of file
+        Now, provide the final JSON tool call.
+        """
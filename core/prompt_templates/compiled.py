@@ -0,0 +1,36 @@
+# core/prompt_templates/compiled.py
+from string import Formatter
+from typing import Tuple
+
+
+class CompiledPrompt:
+    """
+    A str.format-style template split into literal chunks and field names once,
+    at import time, so rendering is a single join instead of re-parsing the
+    whole template on every call. '{{' and '}}' escapes behave as in str.format.
+    """
+
+    def __init__(self, template: str):
+        literals = []
+        fields = []
+        pending = ""
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported placeholder '{{{field_name}!{conversion}:{format_spec}}}' in prompt template.")
+            # Escaped braces split a literal into several pieces; merge them back
+            pending += literal
+            if field_name is not None:
+                literals.append(pending)
+                fields.append(field_name)
+                pending = ""
+        literals.append(pending)
+        self.template = template
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.fields: Tuple[str, ...] = tuple(fields)
+
+    def render(self, **values) -> str:
+        parts = [self.literals[0]]
+        for field_name, literal in zip(self.fields, self.literals[1:]):
+            parts.append(str(values[field_name]))
+            parts.append(literal)
+        return "".join(parts)
@@ -47,16 +47,19 @@ class CreativeAssistantPrompt:
     </response>
     """
 
-    def render(self, user_idea: str, conversation_history: str) -> str:
-        """Assembles the final prompt."""
-        return f"""
-        {self._persona}
-        {self._process}
-        {self._tool_definition}
-        {self._examples}
+    # Persona, process, tool and examples never change, so they are formatted once here
+    _static_prefix = f"""
+        {_persona}
+        {_process}
+        {_tool_definition}
+        {_examples}
         ---
         **Conversation History:**
-        {conversation_history}
+        """
+
+    def render(self, user_idea: str, conversation_history: str) -> str:
+        """Assembles the final prompt."""
+        return self._static_prefix + f"""{conversation_history}
         ---
         **User's Latest Message:** "{user_idea}"
 
@@ -54,19 +54,22 @@ class ChiefOfStaffDispatcherPrompt:
     {MasterRules.JSON_OUTPUT_RULE}
     """
 
-    def render(self, user_prompt: str, conversation_history: str, mission_log_state: str) -> str:
-        """Assembles the final prompt."""
-        return f"""
-        {self._persona}
-        {self._intents}
-        {self._reasoning_structure}
-        {self._output_format}
+    # The fixed part of the briefing, built once instead of on every dispatch
+    _static_prefix = f"""
+        {_persona}
+        {_intents}
+        {_reasoning_structure}
+        {_output_format}
         ---
         **INTELLIGENCE BRIEFING:**
 
         1.  **CONVERSATION HISTORY:**
             ```
-            {conversation_history}
+            """
+
+    def render(self, user_prompt: str, conversation_history: str, mission_log_state: str) -> str:
+        """Assembles the final prompt."""
+        return self._static_prefix + f"""{conversation_history}
             ```
 
         2.  **CURRENT MISSION LOG STATE:**
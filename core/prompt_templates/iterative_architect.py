@@ -1,4 +1,6 @@
 # aura/core/prompt_templates/iterative_architect.py
+from typing import Optional, Tuple
+
 from .rules import MasterRules
 
 
@@ -32,15 +34,35 @@ class IterativeArchitectPrompt:
     {MasterRules.JSON_OUTPUT_RULE}
     """
 
-    def render(self, user_request: str, file_structure: str, relevant_code_snippets: str, available_tools: str) -> str:
-        """Assembles the final prompt string to be sent to the LLM."""
-        return f"""
+    # (tool listing, prefix rendered for it); the listing only changes with the toolbox
+    _prefix_cache: Tuple[Optional[str], str] = (None, "")
+
+    def render_static_prefix(self, available_tools: str) -> str:
+        """Renders the part of the prompt that only changes when the toolbox does."""
+        cached_tools, prefix = self._prefix_cache
+        if cached_tools == available_tools:
+            return prefix
+        prefix = f"""
         {self._persona}
 
         {self._directives}
 
         {self._output_format}
 
+        **AVAILABLE TOOLS:** Your complete toolbox for making modifications.
+            ```json
+            {available_tools}
+            ```
+        """
+        self._prefix_cache = (available_tools, prefix)
+        return prefix
+
+    def render(self, user_request: str, file_structure: str, relevant_code_snippets: str, available_tools: str) -> str:
+        """
+        Assembles the final prompt string to be sent to the LLM. The static
+        instructions come first so every call shares a byte-identical prefix.
+        """
+        return self.render_static_prefix(available_tools) + f"""
         **CONTEXT BUNDLE:**
 
         1.  **USER'S CHANGE REQUEST:** Your immediate objective.
@@ -56,10 +78,5 @@ class IterativeArchitectPrompt:
             {relevant_code_snippets}
             ```
 
-        4.  **AVAILABLE TOOLS:** Your complete toolbox for making modifications.
-            ```json
-            {available_tools}
-            ```
-
         Now, provide the final JSON output.
         """
@@ -1,6 +1,7 @@
 # core/prompt_templates/sentry.py
+from .compiled import CompiledPrompt
 
-SENTRY_PROMPT = """
+SENTRY_PROMPT = CompiledPrompt("""
 You are 'Sentry', a Senior QA Engineer with an expert eye for finding bugs.
 Your task is to analyze a given code file, identify a potential bug or a critical missing test case, and then write a single `pytest` test file that exposes this issue.
 
@@ -30,4 +31,4 @@ File: `{file_path}`
 ```
 
 Now, analyze the provided code and generate the JSON output for the `stream_and_write_file` tool call.
-"""
+""")
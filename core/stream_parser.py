@@ -1,8 +1,11 @@
 # core/stream_parser.py
 import re
-import json
-from typing import Generator, AsyncGenerator
+from typing import Generator, AsyncGenerator, List, Optional
+from core import json_utils
 from core.models.messages import AuraMessage, MessageType
+from core.streaming_json import JsonObjectScanner
+
+_RESPONSE_TAG_RE = re.compile(r'<response>(.*?)</response>', re.DOTALL)
 
 
 class LLMStreamParser:
@@ -15,6 +18,38 @@ class LLMStreamParser:
     def __init__(self):
         self.buffer = ""
         self.plan_processed = False
+        self._scanner = JsonObjectScanner()
+        # Pieces of the JSON object being streamed, or None until its opening brace arrives
+        self._json_parts: Optional[List[str]] = None
+
+    def _scan_for_json(self, chunk: str) -> Optional[str]:
+        """
+        Feeds the chunk to the incremental scanner and returns the first complete,
+        valid JSON object, so each character is scanned once rather than the whole
+        buffer being re-searched on every chunk.
+        """
+        while chunk:
+            if self._json_parts is None:
+                start = chunk.find("{")
+                if start == -1:
+                    return None
+                chunk = chunk[start:]
+                self._json_parts = []
+            end = self._scanner.feed(chunk)
+            if end == -1:
+                self._json_parts.append(chunk)
+                return None
+            self._json_parts.append(chunk[:end])
+            json_str = "".join(self._json_parts)
+            self._json_parts = None
+            self._scanner = JsonObjectScanner()
+            try:
+                json_utils.loads(json_str)
+                return json_str
+            except json_utils.JSONDecodeError:
+                # Balanced but not valid JSON; keep looking in the rest of the chunk.
+                chunk = chunk[end:]
+        return None
 
     def parse_chunk(self, chunk: str) -> Generator[AuraMessage, None, None]:
         """
@@ -26,32 +61,22 @@ class LLMStreamParser:
 
         self.buffer += chunk
 
-        # Aggressively search for a complete JSON object in the buffer.
-        json_match = re.search(r'(\{.*?\})', self.buffer, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-            try:
-                # Validate that the matched string is a complete JSON object.
-                json.loads(json_str)
-
-                # It's a valid plan. Yield it for backend processing.
-                yield AuraMessage(type=MessageType.AGENT_PLAN_JSON, content=json_str)
-
-                # Mark the plan as processed and clear the buffer.
-                # This effectively stops any further parsing of this stream.
-                self.plan_processed = True
-                self.buffer = ""
-                return
+        # Look for a complete JSON object as the stream arrives.
+        json_str = self._scan_for_json(chunk)
+        if json_str is not None:
+            # It's a valid plan. Yield it for backend processing.
+            yield AuraMessage(type=MessageType.AGENT_PLAN_JSON, content=json_str)
 
-            except json.JSONDecodeError:
-                # The buffer contains something that looks like JSON, but it's not
-                # complete yet. Continue buffering to get the full object.
-                pass
+            # Mark the plan as processed and clear the buffer.
+            # This effectively stops any further parsing of this stream.
+            self.plan_processed = True
+            self.buffer = ""
+            return
 
         # This part of the logic will only run if a JSON plan has not yet been found.
         # It handles simple, non-plan conversational responses.
         while True:
-            tag_match = re.search(r'<response>(.*?)</response>', self.buffer, re.DOTALL)
+            tag_match = _RESPONSE_TAG_RE.search(self.buffer)
             if not tag_match:
                 break
 
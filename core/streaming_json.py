@@ -0,0 +1,103 @@
+# core/streaming_json.py
+"""
+Incremental detection of the first top-level JSON object in a streamed LLM
+reply, so callers that only need the JSON can stop reading once it closes.
+"""
+import re
+from typing import AsyncIterator, Optional
+
+# Only these characters can change brace depth or string state.
+_SIGNIFICANT = re.compile(r'[{}"\\]')
+
+
+class JsonObjectScanner:
+    """
+    Tracks brace depth across chunks, ignoring braces inside string literals.
+    Text before the first '{' is skipped, so leading prose is tolerated.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.complete = False
+        self._in_string = False
+        self._escape_pending = False
+
+    def feed(self, chunk: str) -> int:
+        """Scans the next chunk; returns the index just past the object's closing brace, or -1."""
+        if self.complete:
+            return 0
+        skip = 0 if self._escape_pending else -1
+        self._escape_pending = False
+        for match in _SIGNIFICANT.finditer(chunk):
+            pos = match.start()
+            if pos == skip:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == '\\':
+                    skip = pos + 1
+                    self._escape_pending = skip == len(chunk)
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = self.depth > 0
+            elif char == '{':
+                self.depth += 1
+            elif char == '}' and self.depth:
+                self.depth -= 1
+                if not self.depth:
+                    self.complete = True
+                    return pos + 1
+        return -1
+
+
+def extract_first_json_object(text: str) -> Optional[str]:
+    """
+    Returns the first balanced {...} span of text in one linear pass, or None.
+    Unlike a greedy regex this stops at the object's own closing brace, so
+    trailing prose containing braces does not corrupt the result.
+    """
+    end = JsonObjectScanner().feed(text)
+    if end == -1:
+        return None
+    return text[text.index("{"):end]
+
+
+async def collect_text(stream: AsyncIterator[str]) -> str:
+    """Gathers a whole streamed reply into one string, appending chunks and joining once."""
+    parts = []
+    append = parts.append
+    async for chunk in stream:
+        append(chunk)
+    return "".join(parts)
+
+
+async def collect_json_text(stream: AsyncIterator[str], leading_only: bool = False) -> str:
+    """
+    Collects a streamed reply up to the end of its first JSON object and closes
+    the stream there. If no object completes, the whole reply is returned.
+    With leading_only, replies that do not open with '{' are treated as prose
+    and read to the end, so callers that show such replies verbatim get all of it.
+    """
+    scanner = JsonObjectScanner()
+    parts = []
+    watching = True
+    opened = not leading_only
+    try:
+        async for chunk in stream:
+            if watching and not opened:
+                stripped = chunk.lstrip()
+                if stripped:
+                    opened = True
+                    watching = stripped[0] == "{"
+            if watching:
+                end = scanner.feed(chunk)
+                if end != -1:
+                    parts.append(chunk[:end])
+                    break
+            parts.append(chunk)
+    finally:
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return "".join(parts)
@@ -1,17 +1,20 @@
 import asyncio
 import inspect
-from collections import defaultdict
+from typing import Callable, Dict, Tuple
 
 
 class EventBus:
     """A simple, in-process event bus for decoupling components, with async support."""
 
     def __init__(self):
-        self._subscribers = defaultdict(list)
+        # Each event maps to an immutable tuple of (callback, is_coroutine) pairs that is
+        # replaced on subscribe, so emit iterates a stable snapshot without copying or locking.
+        self._subscribers: Dict[str, Tuple[Tuple[Callable, bool], ...]] = {}
 
     def subscribe(self, event_name: str, callback):
         print(f"[EventBus] Subscribing '{getattr(callback, '__name__', 'lambda')}' to event '{event_name}'")
-        self._subscribers[event_name].append(callback)
+        entry = (callback, inspect.iscoroutinefunction(callback))
+        self._subscribers[event_name] = self._subscribers.get(event_name, ()) + (entry,)
 
     def emit(self, event_name: str, *args, **kwargs):
         """
@@ -21,13 +24,12 @@ class EventBus:
         if event_name != "log_message_received": # Avoid spamming the log
              print(f"[EventBus] Emitting event '{event_name}'")
 
-        if event_name in self._subscribers:
-            for callback in self._subscribers[event_name]:
-                try:
-                    if inspect.iscoroutinefunction(callback):
-                        asyncio.create_task(callback(*args, **kwargs))
-                    else:
-                        callback(*args, **kwargs)
-                except Exception as e:
-                    print(f"[EventBus] FATAL: Exception in callback for event '{event_name}': {e}")
-                    print("[EventBus] FATAL: traceback.print_exc() is disabled to prevent recursion.")
+        for callback, is_coroutine in self._subscribers.get(event_name, ()):
+            try:
+                if is_coroutine:
+                    asyncio.create_task(callback(*args, **kwargs))
+                else:
+                    callback(*args, **kwargs)
+            except Exception as e:
+                print(f"[EventBus] FATAL: Exception in callback for event '{event_name}': {e}")
+                print("[EventBus] FATAL: traceback.print_exc() is disabled to prevent recursion.")
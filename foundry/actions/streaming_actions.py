@@ -1,6 +1,7 @@
 # foundry/actions/streaming_actions.py
 import logging
 import re
+import time
 import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,6 +16,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Streamed tokens are forwarded to the code viewer in batches, roughly once per frame.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.016
+STREAM_FLUSH_MAX_CHUNKS = 32
+
 
 def _robustly_clean_llm_output(content: str) -> str:
     """Cleans markdown and other noise from the LLM's code output.""" 
@@ -37,8 +42,8 @@ async def stream_and_write_file(path: str, task_description: str, project_manage
     file_path_obj = Path(path)
     relative_path = str(file_path_obj)  # Assume path is already relative from runner
 
-    # Get project context for the Coder prompt
-    file_tree = "\n".join(sorted(list(project_manager.get_project_files().keys()))) or "The project is currently empty."
+    # Get project context for the Coder prompt; the listing is cached until files change
+    file_tree = project_manager.get_file_structure() or "The project is currently empty."
 
     # Define the streaming coder prompt directly within the action
     coder_prompt_streaming = f"""
@@ -77,11 +82,22 @@ async def stream_and_write_file(path: str, task_description: str, project_manage
     event_bus.emit("stream_code_chunk", StreamCodeChunk(filename=relative_path, chunk="", is_first_chunk=True))
     await asyncio.sleep(0.01)
 
+    pending_chunks = []
+    last_flush = time.monotonic()
     try:
         async for chunk in llm_client.stream_chat(provider, model, prompt, "coder"):
-            event_bus.emit("stream_code_chunk", StreamCodeChunk(filename=relative_path, chunk=chunk))
             raw_code_accumulator.append(chunk)
-            await asyncio.sleep(0.01)
+            pending_chunks.append(chunk)
+            now = time.monotonic()
+            if len(pending_chunks) >= STREAM_FLUSH_MAX_CHUNKS or now - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                # One emit per batch keeps the editor from repainting on every token
+                event_bus.emit("stream_code_chunk", StreamCodeChunk(filename=relative_path, chunk="".join(pending_chunks)))
+                pending_chunks.clear()
+                last_flush = now
+                await asyncio.sleep(0)
+
+        if pending_chunks:
+            event_bus.emit("stream_code_chunk", StreamCodeChunk(filename=relative_path, chunk="".join(pending_chunks)))
 
         full_raw_code = "".join(raw_code_accumulator)
         cleaned_code = _robustly_clean_llm_output(full_raw_code)
@@ -4,8 +4,9 @@ import importlib
 import inspect
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from core import json_utils
 from foundry.blueprints import Blueprint
 
 logger = logging.getLogger(__name__)
@@ -39,6 +40,12 @@ class FoundryManager:
     def __init__(self) -> None:
         self._blueprints: Dict[str, Blueprint] = {}
         self._actions: Dict[str, Callable[..., Any]] = {}
+        # Bumped on every rescan so callers can tell when cached tool data is stale.
+        self.version = 0
+        # (version, processed tool definitions) so the schemas are deep-copied once per rescan
+        self._tool_definitions_cache: Optional[Tuple[int, List[Dict[str, Any]]]] = None
+        # (version, definitions serialized for prompts)
+        self._tool_definitions_json_cache: Optional[Tuple[int, str]] = None
 
         self.rescan_and_load()
 
@@ -60,6 +67,7 @@ class FoundryManager:
         # Reload everything
         self._discover_and_load_actions()
         self._discover_and_load_blueprints()
+        self.version += 1
 
         logger.info(
             f"FoundryManager re-initialized with {len(self._blueprints)} blueprints and {len(self._actions)} actions.")
@@ -142,7 +150,12 @@ class FoundryManager:
     def get_llm_tool_definitions(self) -> List[Dict[str, Any]]:
         """
         Gets the list of tool definitions, processing them for provider-specific quirks.
+        The processed definitions are cached until the next rescan.
         """
+        cache = self._tool_definitions_cache
+        if cache is not None and cache[0] == self.version:
+            return list(cache[1])
+
         definitions: List[Dict[str, Any]] = []
         for bp in self._blueprints.values():
             # Create a deep copy to avoid modifying the original blueprint's schema in memory
@@ -158,4 +171,16 @@ class FoundryManager:
                 "parameters": processed_params  # Use the processed version
             }
             definitions.append(tool_def)
-        return definitions
\ No newline at end of file
+        self._tool_definitions_cache = (self.version, definitions)
+        return list(definitions)
+
+    def get_llm_tool_definitions_json(self) -> str:
+        """
+        Returns the tool definitions as indented JSON for prompts, serialized once per rescan.
+        Keys are sorted so the text is byte-stable across runs.
+        """
+        cache = self._tool_definitions_json_cache
+        if cache is None or cache[0] != self.version:
+            tools_json = json_utils.dumps(self.get_llm_tool_definitions(), indent=True, sort_keys=True).decode('utf-8')
+            cache = self._tool_definitions_json_cache = (self.version, tools_json)
+        return cache[1]
\ No newline at end of file
@@ -68,7 +68,7 @@ class GeminiProvider(LLMProvider):
 
         final_prompt = prompt
         if context:
-            context_str = "\n\n".join([f"Content of file '{k}':\n```\n{v}\n```" for k, v in context.items()])
+            context_str = "\n\n".join(f"Content of file '{k}':\n```\n{v}\n```" for k, v in context.items())
             final_prompt = f"--- CONTEXT ---\n{context_str}\n--- END CONTEXT ---\n\nUser Prompt: {prompt}"
             logger.info(f"Injecting context for {len(context)} files into the Gemini prompt.")
 
@@ -2,13 +2,14 @@
 """
 Agent Workflow Manager - Fixed version with proper chat handling
 """
-import json
 import logging
-import re
-from typing import TYPE_CHECKING, List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
+from core import json_utils
+from core.history_formatter import HistoryFormatter
 from core.models.messages import AuraMessage, MessageType
 from core.prompt_templates import CreativeAssistantPrompt, IterativeArchitectPrompt
+from core.streaming_json import collect_json_text, collect_text, extract_first_json_object
 from event_bus import EventBus
 
 
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+
 class AgentWorkflowManager:
     """
     Manages different agent workflows for various types of interactions.
@@ -32,14 +34,21 @@ class AgentWorkflowManager:
             llm_client: "LLMClient",
             mission_log_service: "MissionLogService",
             project_manager: "ProjectManager",
-            foundry_manager: "FoundryManager"
+            foundry_manager: "FoundryManager",
+            history_formatter: Optional[HistoryFormatter] = None
     ):
         self.event_bus = event_bus
         self.llm_client = llm_client
         self.mission_log_service = mission_log_service
         self.project_manager = project_manager
         self.foundry_manager = foundry_manager
+        self.history_formatter = history_formatter or HistoryFormatter()
+        self._creative_prompt = CreativeAssistantPrompt()
+        self._iterative_architect_prompt = IterativeArchitectPrompt()
         self._agent_workflows = None  # Defer initialization
+        # Most recent agent status on the bus, whoever emitted it
+        self._last_status: Optional[tuple] = None
+        self.event_bus.subscribe("agent_status_changed", self._remember_status)
         logger.info("AgentWorkflowManager initialized.")
 
     def _initialize_workflows(self):
@@ -61,6 +70,14 @@ class AgentWorkflowManager:
                 }
             }
 
+    def _remember_status(self, agent: str, status: str, icon: str):
+        self._last_status = (agent, status, icon)
+
+    def _set_status(self, agent: str, status: str, icon: str):
+        """Emits agent_status_changed only when the status actually changes"""
+        if (agent, status, icon) != self._last_status:
+            self.event_bus.emit("agent_status_changed", agent, status, icon)
+
     def log(self, level: str, message: str):
         """Log messages to the event bus"""
         print(f"[AgentWorkflowManager] {level.upper()}: {message}")
@@ -69,12 +86,12 @@ class AgentWorkflowManager:
     def handle_error(self, agent: str, error_msg: str):
         """Handle and display errors properly"""
         self.log("error", f"{agent} failed: {error_msg}")
-        self.event_bus.emit("agent_status_changed", "Aura", "Failed", "fa5s.exclamation-triangle")
+        self._set_status("Aura", "Failed", "fa5s.exclamation-triangle")
         self._post_structured_message(AuraMessage.error(error_msg))
 
     def _post_structured_message(self, message: AuraMessage):
         """Post a structured message to the command deck"""
-        if message.content and message.content.strip():
+        if message.content and not message.content.isspace():
             self.event_bus.emit("post_structured_message", message)
 
     def _generate_fallback_response(self, user_idea: str) -> str:
@@ -100,7 +117,7 @@ class AgentWorkflowManager:
         """
         try:
             self.log("info", f"Handling general chat for: '{user_idea[:50]}...'")
-            self.event_bus.emit("agent_status_changed", "Aura", "Thinking...", "fa5s.comment-dots")
+            self._set_status("Aura", "Thinking...", "fa5s.comment-dots")
 
             # Get chat model
             provider, model = self.llm_client.get_model_for_role("chat")
@@ -124,20 +141,12 @@ class AgentWorkflowManager:
             self.event_bus.emit("processing_started")
 
             try:
-                # Stream the response
-                response_text = ""
-                has_content = False
-
                 stream_chunks = self.llm_client.stream_chat(provider, model, prompt, "chat", history=history)
-
-                # Collect and display response
-                async for chunk in stream_chunks:
-                    if chunk and chunk.strip():
-                        response_text += chunk
-                        has_content = True
+                # Whitespace-only chunks are kept: they carry the spaces and line breaks between words
+                response_text = await collect_text(stream_chunks)
 
                 # Post the complete response
-                if has_content and response_text.strip():
+                if response_text and not response_text.isspace():
                     self._post_structured_message(AuraMessage.agent_response(response_text.strip()))
                 else:
                     # Fallback response if nothing was generated
@@ -157,18 +166,18 @@ class AgentWorkflowManager:
             self.handle_error("Aura", f"Chat workflow error: {str(e)}")
         finally:
             self.event_bus.emit("processing_finished")
-            self.event_bus.emit("agent_status_changed", "Aura", "Ready", "fa5s.check-circle")
+            self._set_status("Aura", "Ready", "fa5s.check-circle")
 
     def _build_chat_prompt(self, user_input: str, history: List[Dict]) -> str:
         """
         Build an effective chat prompt that ensures good responses.
         """
         # Format recent history
-        recent_history = ""
-        if history:
-            for msg in history[-5:]:  # Last 5 messages
-                role = "Human" if msg.get("role") == "user" else "Assistant"
-                recent_history += f"{role}: {msg.get('content', '')}\n"
+        # Last 5 messages, assembled with a single join
+        recent_history = "".join(
+            f"{'Human' if msg.get('role') == 'user' else 'Assistant'}: {msg.get('content', '')}\n"
+            for msg in history[-5:]
+        ) if history else ""
 
         prompt = f"""You are Aura, an enthusiastic and helpful AI coding assistant. You love helping developers build amazing software!
 
@@ -188,26 +197,23 @@ Your personality traits:
         """
         try:
             self.log("info", f"Running Creative Assistant workflow for: '{user_idea[:50]}...'")
-            self.event_bus.emit("agent_status_changed", "Creative Assistant", "Brainstorming...", "fa5s.lightbulb")
+            self._set_status("Creative Assistant", "Brainstorming...", "fa5s.lightbulb")
 
             provider, model = self.llm_client.get_model_for_role("planner")
             if not provider or not model:
                 self.handle_error("Creative Assistant", "No 'planner' model configured.")
                 return
 
-            conv_history_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in conversation_history])
+            conv_history_str = self.history_formatter.format(conversation_history)
 
-            prompt_template = CreativeAssistantPrompt()
+            prompt_template = self._creative_prompt
             prompt = prompt_template.render(user_idea=user_idea, conversation_history=conv_history_str)
 
             self.event_bus.emit("processing_started")
-            response_text = ""
             stream_chunks = self.llm_client.stream_chat(provider, model, prompt, "creative_assistant")
+            response_text = await collect_text(stream_chunks)
 
-            async for chunk in stream_chunks:
-                response_text += chunk
-
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 self._post_structured_message(AuraMessage.agent_response(response_text.strip()))
             else:
                 self._post_structured_message(AuraMessage.agent_response("I seem to be out of ideas at the moment. Could you rephrase your request?"))
@@ -216,7 +222,7 @@ Your personality traits:
             self.handle_error("Creative Assistant", f"Workflow error: {str(e)}")
         finally:
             self.event_bus.emit("processing_finished")
-            self.event_bus.emit("agent_status_changed", "Aura", "Ready", "fa5s.check-circle")
+            self._set_status("Aura", "Ready", "fa5s.check-circle")
 
 
     async def _run_iterative_architect_workflow(self, user_idea: str, conversation_history: List[Dict]) -> None:
@@ -225,41 +231,36 @@ Your personality traits:
         """
         try:
             self.log("info", f"Running Iterative Architect workflow for: '{user_idea[:50]}...'")
-            self.event_bus.emit("agent_status_changed", "Iterative Architect", "Refining plan...", "fa5s.drafting-compass")
+            self._set_status("Iterative Architect", "Refining plan...", "fa5s.drafting-compass")
 
             provider, model = self.llm_client.get_model_for_role("planner")
             if not provider or not model:
                 self.handle_error("Iterative Architect", "No 'planner' model configured.")
                 return
 
-            mission_log_summary = self.mission_log_service.get_log_as_string_summary()
-            conv_history_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in conversation_history])
+            available_tools = self.foundry_manager.get_llm_tool_definitions_json()
 
-            prompt_template = IterativeArchitectPrompt()
-            prompt = prompt_template.render(
-                user_idea=user_idea,
-                conversation_history=conv_history_str,
-                mission_log_state=mission_log_summary
+            prompt = self._iterative_architect_prompt.render(
+                user_request=user_idea,
+                file_structure=self.project_manager.get_file_structure() or "The project is currently empty.",
+                relevant_code_snippets="No code snippets were retrieved for this request.",
+                available_tools=available_tools
             )
 
             self.event_bus.emit("processing_started")
-            response_text = ""
             stream_chunks = self.llm_client.stream_chat(provider, model, prompt, "iterative_architect")
+            response_text = await collect_json_text(stream_chunks, leading_only=True)
 
-            async for chunk in stream_chunks:
-                response_text += chunk
-
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 try:
-                    json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                    if json_match:
-                        response_data = json.loads(json_match.group(0))
+                    json_text = extract_first_json_object(response_text)
+                    if json_text:
+                        response_data = json_utils.loads(json_text)
                         if "plan" in response_data:
                             plan_steps = response_data.get("plan", [])
                             if plan_steps:
                                 self.mission_log_service.clear_tasks()
-                                for step in plan_steps:
-                                    self.mission_log_service.add_task(step)
+                                self.mission_log_service.add_tasks((step, None) for step in plan_steps)
                                 self._post_structured_message(AuraMessage.agent_response("I've updated the plan based on your feedback. Please review the 'Agent TODO' list."))
                             else:
                                 self._post_structured_message(AuraMessage.agent_response("The plan came back empty, but here's the thought process: " + response_data.get("thought", "")))
@@ -268,7 +269,7 @@ Your personality traits:
                             self._post_structured_message(AuraMessage.agent_response(response_text.strip()))
                     else:
                          self._post_structured_message(AuraMessage.agent_response(response_text.strip()))
-                except json.JSONDecodeError:
+                except json_utils.JSONDecodeError:
                     self._post_structured_message(AuraMessage.agent_response(response_text.strip()))
             else:
                 self._post_structured_message(AuraMessage.agent_response("I couldn't seem to refine the plan. Could you provide more specific feedback?"))
@@ -277,4 +278,4 @@ Your personality traits:
             self.handle_error("Iterative Architect", f"Workflow error: {str(e)}")
         finally:
             self.event_bus.emit("processing_finished")
-            self.event_bus.emit("agent_status_changed", "Aura", "Ready", "fa5s.check-circle")
+            self._set_status("Aura", "Ready", "fa5s.check-circle")
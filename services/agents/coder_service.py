@@ -1,10 +1,11 @@
 # services/agents/coder_service.py
-import json
-import re
-from typing import Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional
 
+from core import json_utils
 from event_bus import EventBus
 from core.llm_client import LLMClient
+from core.streaming_json import collect_json_text, extract_first_json_object
 from services.vector_context_service import VectorContextService
 from core.managers.project_manager import ProjectManager
 from foundry import FoundryManager
@@ -36,10 +37,47 @@ class CoderService:
         self.event_bus.emit("log_message_received", "CoderService", level, message)
 
     def _parse_json_response(self, response: str) -> dict:
-        match = re.search(r'\{.*\}', response, re.DOTALL)
-        if not match:
+        json_text = extract_first_json_object(response)
+        if json_text is None:
             raise ValueError("No JSON object found in the response.")
-        return json.loads(match.group(0))
+        return json_utils.loads(json_text)
+
+    @staticmethod
+    def _build_snippet_context(retrieved_chunks: List[Dict[str, Any]]) -> str:
+        """Renders retrieved chunks as fenced snippets, appending raw segments and joining once."""
+        parts = ["Here are the most relevant code snippets based on the task:\n"]
+        append = parts.append
+        for chunk in retrieved_chunks:
+            metadata = chunk['metadata']
+            append("\n\n```python\n# From file: ")
+            append(metadata.get('file_path', 'N/A'))
+            append(" (")
+            append(metadata.get('node_type', 'N/A'))
+            append(": ")
+            append(metadata.get('node_name', 'N/A'))
+            append(")\n")
+            append(chunk['document'])
+            append("\n```")
+        return "".join(parts)
+
+    def _query_vector_store(self, current_task: str) -> Optional[List[Dict[str, Any]]]:
+        """Blocking RAG lookup; returns None when the vector database is empty."""
+        if not self.vector_context_service or self.vector_context_service.collection.count() == 0:
+            return None
+        return self.vector_context_service.query(current_task, n_results=5)
+
+    async def _fetch_rag_context(self, current_task: str) -> str:
+        relevant_context = "No existing code snippets were found. You are likely creating a new file or starting a new project."
+        try:
+            retrieved_chunks = await asyncio.to_thread(self._query_vector_store, current_task)
+            if retrieved_chunks is None:
+                self.log("warning", "Vector database is empty. Proceeding without RAG context.")
+            elif retrieved_chunks:
+                relevant_context = self._build_snippet_context(retrieved_chunks)
+        except Exception as e:
+            self.log("error", f"Failed to query vector context: {e}")
+            relevant_context = f"Error: Could not retrieve context from the vector database. Details: {e}"
+        return relevant_context
 
     async def run_coding_task(
         self,
@@ -51,27 +89,13 @@ class CoderService:
         self.log("info", f"Translating task to tool call: {current_task}")
         self.event_bus.emit("agent_status_changed", "Coder", f"Planning action for: {current_task}...", "fa5s.cogs")
 
-        # 1. Get relevant context using RAG
-        relevant_context = "No existing code snippets were found. You are likely creating a new file or starting a new project."
-        try:
-            if self.vector_context_service and self.vector_context_service.collection.count() > 0:
-                retrieved_chunks = self.vector_context_service.query(current_task, n_results=5)
-                if retrieved_chunks:
-                    context_parts = ["Here are the most relevant code snippets based on the task:\n"]
-                    for chunk in retrieved_chunks:
-                        metadata = chunk['metadata']
-                        source_info = f"From file: {metadata.get('file_path', 'N/A')} ({metadata.get('node_type', 'N/A')}: {metadata.get('node_name', 'N/A')})"
-                        context_parts.append(f"```python\n# {source_info}\n{chunk['document']}\n```")
-                    relevant_context = "\n\n".join(context_parts)
-            else:
-                self.log("warning", "Vector database is empty. Proceeding without RAG context.")
-        except Exception as e:
-            self.log("error", f"Failed to query vector context: {e}")
-            relevant_context = f"Error: Could not retrieve context from the vector database. Details: {e}"
-
-        # 2. Get the file tree and available tools
-        file_structure = "\n".join(sorted(list(self.project_manager.get_project_files().keys()))) or "The project is currently empty."
-        available_tools = json.dumps(self.foundry_manager.get_llm_tool_definitions(), indent=2)
+        # 1-2. The RAG query and the file tree both block on disk, so run them side by side off the loop
+        relevant_context, file_structure = await asyncio.gather(
+            self._fetch_rag_context(current_task),
+            asyncio.to_thread(self.project_manager.get_file_structure)
+        )
+        file_structure = file_structure or "The project is currently empty."
+        available_tools = self.foundry_manager.get_llm_tool_definitions_json()
 
         # 3. Build the prompt
         prompt = CODER_PROMPT.format(
@@ -87,13 +111,13 @@ class CoderService:
             self.log("error", "No 'coder' model configured.")
             return None
 
-        response_str = "".join([chunk async for chunk in self.llm_client.stream_chat(provider, model, prompt, "coder")])
+        response_str = await collect_json_text(self.llm_client.stream_chat(provider, model, prompt, "coder"))
 
         try:
             tool_call = self._parse_json_response(response_str)
             if "tool_name" not in tool_call or "arguments" not in tool_call:
                 raise ValueError("Coder response must be a JSON object with 'tool_name' and 'arguments' keys.")
             return tool_call
-        except (ValueError, json.JSONDecodeError) as e:
+        except (ValueError, json_utils.JSONDecodeError) as e:
             self.log("error", f"Coder generation failure. Raw response: {response_str}. Error: {e}")
             return None
\ No newline at end of file
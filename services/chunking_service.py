@@ -13,7 +13,7 @@ class ChunkingService:
         print("[ChunkingService] Initialized.")
 
     def chunk_document(self, content: str, file_path_str: str) -> List[Dict[str, Any]]:
-        if not content or not content.strip():
+        if not content or content.isspace():
             return []
         file_path = Path(file_path_str)
         chunks = self._chunk_generic_text(content, file_path)
@@ -1,10 +1,11 @@
 # services/conductor_service.py
 import logging
 import asyncio
+import os
 import re
-from pathlib import Path
 from typing import Dict, Optional, Tuple, Any, Union
 
+from core import json_utils
 from event_bus import EventBus
 from services.mission_log_service import MissionLogService
 from services.tool_runner_service import ToolRunnerService
@@ -13,6 +14,11 @@ from events import PostChatMessage, MissionAccomplished
 
 logger = logging.getLogger(__name__)
 
+_FAILURE_STATUSES = frozenset({"failure", "error", "failed"})
+_CODE_GENERATION_KEYWORDS = ("create file", "write code", "implement", "define function", "add class")
+# A quoted or backticked .py path inside a task description.
+_QUOTED_PY_PATH_RE = re.compile(r"[`']([^`']+\.py)[`']")
+
 
 class ConductorService:
     """
@@ -70,12 +76,11 @@ class ConductorService:
                     self.log("info", "Mission execution was externally stopped.")
                     break
 
-                pending_tasks = self.mission_log_service.get_tasks(done=False)
-                if not pending_tasks:
+                current_task = next(self.mission_log_service.get_pending_tasks(), None)
+                if current_task is None:
                     await self._handle_mission_completion()
                     break
 
-                current_task = pending_tasks[0]
                 task_succeeded = False
 
                 if self.quality_tier == "PRODUCTION" and self._is_code_generation_task(current_task):
@@ -118,11 +123,17 @@ class ConductorService:
                 self.log("warning", f"{error_msg}. Retry {retry_count}/{self.MAX_RETRIES_PER_TASK}.")
                 continue
 
+            # Reject an unknown or malformed call before it reaches the tool runner
+            _, invalid_msg = self.tool_runner_service.validate_tool_call(tool_call)
+            if invalid_msg:
+                current_task['last_error'] = invalid_msg
+                retry_count += 1
+                self.log("warning", f"{invalid_msg} Retry {retry_count}/{self.MAX_RETRIES_PER_TASK}.")
+                continue
+
             self.log("info",
                      f"Executing tool: {tool_call.get('tool_name')} with arguments: {tool_call.get('arguments', {})}")
             result = await self.tool_runner_service.run_tool_by_dict(tool_call)
-
-            self.log("info", f"Tool execution result: {result}")
             result_is_error, error_message = self._is_result_an_error(result)
 
             if not result_is_error:
@@ -135,7 +146,11 @@ class ConductorService:
                 else:
                     self.log("error", f"Failed to mark task {current_task['id']} as done in mission log.")
             else:
-                current_task['last_error'] = error_message
+                # Render the failed result once; the log and the coder's retry context share the text
+                result_text = self._format_error_context(result)
+                self.log("info", f"Tool execution result: {result_text}")
+                current_task['last_error'] = (error_message if result_text == error_message
+                                              else f"{error_message}\nTool result: {result_text}")
                 retry_count += 1
                 self.log("warning",
                          f"Task {current_task['id']} failed. Error: {error_message}. Retry {retry_count}/{self.MAX_RETRIES_PER_TASK}.")
@@ -154,11 +169,11 @@ class ConductorService:
             current_task['last_error'] = str(e)
             return False
 
-        self.event_bus.emit("agent_status_changed", "Sentry", f"Writing tests for {Path(impl_path).name}...",
+        self.event_bus.emit("agent_status_changed", "Sentry", f"Writing tests for {os.path.basename(impl_path)}...",
                             "fa5s.shield-alt")
         sentry_result = await self.development_team_service.run_sentry_task(current_task)
         if self._is_result_an_error(sentry_result)[0]:
-            current_task['last_error'] = f"Sentry failed to write tests: {sentry_result}"
+            current_task['last_error'] = f"Sentry failed to write tests: {self._format_error_context(sentry_result)}"
             return False
         self._post_chat_message("Sentry", f"Wrote initial failing tests to `{test_path}`.")
 
@@ -172,7 +187,7 @@ class ConductorService:
 
         write_result = await self.tool_runner_service.run_tool_by_dict(tool_call)
         if self._is_result_an_error(write_result)[0]:
-            current_task['last_error'] = f"Coder failed to write implementation file: {write_result}"
+            current_task['last_error'] = f"Coder failed to write implementation file: {self._format_error_context(write_result)}"
             return False
         self._post_chat_message("Coder", f"Wrote implementation code to `{impl_path}`.")
 
@@ -183,7 +198,8 @@ class ConductorService:
             "arguments": {"command": test_command}
         })
 
-        if "failed" in test_result_str.lower() or "error" in test_result_str.lower():
+        test_result_lower = str(test_result_str).lower()
+        if "failed" in test_result_lower or "error" in test_result_lower:
             current_task['last_error'] = f"Tests failed. Pytest output:\n{test_result_str}"
             self._post_chat_message("Conductor", "Tests failed. The code is not yet correct.", is_error=True)
             return False
@@ -199,8 +215,7 @@ class ConductorService:
     def _is_code_generation_task(self, task: dict) -> bool:
         """Heuristically determines if a task is about writing code."""
         desc = task['description'].lower()
-        keywords = ["create file", "write code", "implement", "define function", "add class"]
-        if any(keyword in desc for keyword in keywords):
+        if any(keyword in desc for keyword in _CODE_GENERATION_KEYWORDS):
             return True
         if task.get("tool_call", {}).get("tool_name") == "stream_and_write_file":
             return True
@@ -209,16 +224,15 @@ class ConductorService:
     def _get_paths_for_task(self, task: dict) -> Tuple[str, str]:
         """Extracts the implementation path from the task and derives the test path."""
         desc = task['description']
-        match = re.search(r"[`']([^`']+\.py)[`']", desc)
+        match = _QUOTED_PY_PATH_RE.search(desc)
         if not match:
             raise ValueError("Could not determine the target file path from the task description.")
 
         relative_impl_path = match.group(1)
-        impl_path = Path(relative_impl_path)
-        test_filename = f"test_{impl_path.name}"
-        relative_test_path = Path("tests") / test_filename
+        # Plain string path ops, equivalent to the pathlib version without building Path objects
+        relative_test_path = os.path.join("tests", f"test_{os.path.basename(relative_impl_path)}")
 
-        return str(relative_impl_path), str(relative_test_path)
+        return relative_impl_path, relative_test_path
 
     def _is_result_an_error(self, result: Any) -> Tuple[bool, Optional[str]]:
         """
@@ -228,30 +242,35 @@ class ConductorService:
         if result is None:
             return True, "Tool returned None result"
 
-        if isinstance(result, str):
-            result_lower = result.strip().lower()
-            if result_lower.startswith("error"):
-                return True, result
-            if "error:" in result_lower or "failed:" in result_lower:
-                return True, result
-            if result_lower.startswith("❌"):
-                return True, result
-            return False, None
-
         if isinstance(result, dict):
-            status = result.get('status', '').lower()
-            if status in ["failure", "error", "failed"]:
+            status = result.get('status', '')
+            if isinstance(status, str) and status.lower() in _FAILURE_STATUSES:
                 return True, result.get('summary') or result.get('message') or result.get(
                     'full_output') or "Unknown error from tool."
             if result.get('error'):
                 return True, str(result.get('error'))
             return False, None
 
+        if isinstance(result, str):
+            result_lower = result.strip().lower()
+            if result_lower.startswith(("error", "❌")):
+                return True, result
+            if "error:" in result_lower or "failed:" in result_lower:
+                return True, result
+            return False, None
+
         if isinstance(result, bool):
             return not result, "Tool returned False" if not result else None
 
         return False, None
 
+    @staticmethod
+    def _format_error_context(result: Any) -> str:
+        """Renders a tool result once, compactly, for logs and error reports fed back to the LLM."""
+        if isinstance(result, dict):
+            return json_utils.dumps(result, default=str).decode('utf-8')
+        return str(result)
+
     async def _execute_strategic_replan(self, failed_task: Dict):
         """Triggers the Development Team to create a new plan to overcome a persistent failure."""
         await self.development_team_service.run_strategic_replan(
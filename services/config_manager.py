@@ -3,15 +3,38 @@
 Manages application configuration from a `config.yaml` file.
 """
 
+import json
 import logging
 import os
+import stat
+import tempfile
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
 import yaml
-from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 CONFIG_FILE_PATH = "config.yaml"
 
+# Prefer libyaml's C implementation when PyYAML was built with it.
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Frozen parsed configs keyed by (absolute path, mtime_ns, size), shared by every ConfigManager.
+_YAML_CACHE: "OrderedDict[Tuple[str, int, int], Mapping[str, Any]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Parsed config is also persisted next to the YAML so later startups can skip the parser.
+# JSON rather than pickle: a tampered cache file must never be able to execute code.
+CONFIG_CACHE_SUFFIX = ".cache"
+
+# Environment variables with this prefix override individual config keys at lookup time.
+ENV_PREFIX = "AURA_"
+
 DEFAULT_CONFIG = {
     'llm_provider': 'gemini',
     'plan_temperature': 0.6,
@@ -28,56 +51,237 @@ DEFAULT_CONFIG = {
 }
 
 
+def _freeze(obj: Any) -> Any:
+    """Recursively converts dicts to read-only mappings and lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(x) for x in obj)
+    return obj
+
+
+def _flatten(tree: Mapping[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yields (dotted_key, value) for every node, interior mappings included, so sections stay addressable."""
+    for k, v in tree.items():
+        path = f"{prefix}{k}"
+        yield path, v
+        if isinstance(v, Mapping):
+            yield from _flatten(v, path + '.')
+
+
+def _env_var_for(key: str) -> str:
+    """Maps a dotted config key to the environment variable that overrides it."""
+    return ENV_PREFIX + key.upper().replace('.', '_')
+
+
+_FROZEN_DEFAULT_CONFIG: Mapping[str, Any] = _freeze(DEFAULT_CONFIG)
+_DEFAULT_FLAT: Dict[str, Any] = dict(_flatten(_FROZEN_DEFAULT_CONFIG))
+
+
+def _target_mode(path: str) -> int:
+    """Mode the written file should have: the existing file's, or what open() would give a new one."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_atomically(path: str, data: bytes) -> None:
+    """Writes data to a temp file beside path, then swaps it in, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp creates the file 0600; keep the permissions a plain write would have produced
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class ConfigManager:
     """
     Handles loading and accessing configuration from a YAML file.
+    Any key can be overridden by an AURA_-prefixed environment variable,
+    e.g. AURA_OLLAMA_MODEL for 'ollama.model'. Only leaf keys can be overridden, and the
+    value is converted to the type of the file or default value (bool, int or float).
     """
 
+    _instances: Dict[str, "ConfigManager"] = {}
+    _instances_lock = threading.Lock()
+
+    def __new__(cls, config_path: str = CONFIG_FILE_PATH) -> "ConfigManager":
+        # One instance per config file, so the file is loaded at most once per process.
+        abs_path = os.path.abspath(config_path)
+        with cls._instances_lock:
+            instance = cls._instances.get(abs_path)
+            if instance is None:
+                instance = super().__new__(cls)
+                instance._initialized = False
+                cls._instances[abs_path] = instance
+        return instance
+
     def __init__(self, config_path: str = CONFIG_FILE_PATH) -> None:
+        if self._initialized:
+            return
+        self._initialized = True
         self.config_path = config_path
-        self.config: Dict[str, Any] = {}
+        self.config: Mapping[str, Any] = MappingProxyType({})
+        self._flat: Dict[str, Any] = {}
+        self._env_keys: Dict[str, str] = {}
         self._load_or_create_config()
 
     def _load_or_create_config(self) -> None:
-        if not os.path.exists(self.config_path):
-            logger.info(f"Config file not found. Creating default '{self.config_path}'.")
-            self._create_default_config()
-
-        self._load_config()
+        # Opening the file is the existence check; no separate stat on the common path.
+        try:
+            self._load_config()
+            return
+        except FileNotFoundError:
+            logger.info("Config file not found. Creating default '%s'.", self.config_path)
+        if not self._create_default_config():
+            self._set_config(_FROZEN_DEFAULT_CONFIG)
+            return
+        try:
+            self._load_config()
+        except FileNotFoundError as e:
+            self._load_defaults(e)
 
-    def _create_default_config(self) -> None:
+    def _create_default_config(self) -> bool:
+        """Writes DEFAULT_CONFIG to disk. Returns False if nothing was written."""
+        target_dir = os.path.dirname(self.config_path) or '.'
+        if not os.access(target_dir, os.W_OK):
+            logger.info("Config dir '%s' not writable; using in-memory defaults.", target_dir)
+            return False
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False, sort_keys=False)
-            logger.info(f"Default config file created. Please review '{self.config_path}'.")
+            data = yaml.dump(DEFAULT_CONFIG, Dumper=YamlDumper, default_flow_style=False, sort_keys=False,
+                             encoding='utf-8')
+            _write_atomically(self.config_path, data)
+            logger.info("Default config file created. Please review '%s'.", self.config_path)
+            return True
         except IOError as e:
-            logger.error(f"Failed to create default config file: {e}")
+            logger.error("Failed to create default config file: %s", e)
+            return False
 
     def _load_config(self) -> None:
+        """Loads the config file; raises FileNotFoundError if it does not exist."""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = yaml.safe_load(f) or {}
-                logger.info(f"Configuration loaded successfully from '{self.config_path}'.")
+            config = self._read_config()
+        except FileNotFoundError:
+            raise
         except (IOError, yaml.YAMLError) as e:
-            logger.error(f"Error loading or parsing config file '{self.config_path}': {e}")
-            self.config = DEFAULT_CONFIG
-            logger.warning("Falling back to default configuration due to load error.")
+            self._load_defaults(e)
+            return
+        self._set_config(config)
 
-    def get(self, key: str, default: Optional[Any] = None) -> Any:
-        keys = key.split('.')
-        value = self.config
+    def _load_defaults(self, error: Exception) -> None:
+        logger.error("Error loading or parsing config file '%s': %s", self.config_path, error)
+        logger.warning("Falling back to default configuration due to load error.")
+        self._set_config(_FROZEN_DEFAULT_CONFIG)
+
+    def _set_config(self, config: Mapping[str, Any]) -> None:
+        self.config = config
+        self._flat = dict(_flatten(config)) if isinstance(config, Mapping) else {}
+        # e.g. 'gemini.model' -> 'AURA_GEMINI_MODEL'; precomputed so get() does no string work.
+        # Sections are left out: a string can never stand in for a mapping.
+        leaf_keys = {k for k, v in self._flat.items() if not isinstance(v, Mapping)}
+        leaf_keys.update(k for k, v in _DEFAULT_FLAT.items() if k not in self._flat and not isinstance(v, Mapping))
+        self._env_keys = {k: _env_var_for(k) for k in leaf_keys}
+
+    def _read_config(self) -> Mapping[str, Any]:
+        """Returns the parsed config, frozen so it can be shared without defensive copies."""
+        fd = os.open(self.config_path, os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            cache_key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+            with _YAML_CACHE_LOCK:
+                cached = _YAML_CACHE.get(cache_key)
+                if cached is not None:
+                    _YAML_CACHE.move_to_end(cache_key)
+            if cached is not None:
+                logger.info("Configuration loaded from cache for '%s'.", self.config_path)
+                return cached
+
+            config = self._read_sidecar(st)
+            if config is not None:
+                logger.info("Configuration loaded from '%s%s'.", self.config_path, CONFIG_CACHE_SUFFIX)
+            else:
+                raw = os.read(fd, max(st.st_size, 1))
+                config = yaml.load(raw, Loader=YamlLoader) or {}
+                logger.info("Configuration loaded successfully from '%s'.", self.config_path)
+                self._write_sidecar(st, config)
+        finally:
+            os.close(fd)
+
+        frozen = _freeze(config)
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[cache_key] = frozen
+            if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+        return frozen
+
+    def _read_sidecar(self, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Returns the cached parse if the sidecar was written for this exact version of the YAML file."""
         try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            default_value = DEFAULT_CONFIG
+            with open(self.config_path + CONFIG_CACHE_SUFFIX, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict):
+            return None
+        if cached.get('mtime_ns') != st.st_mtime_ns or cached.get('size') != st.st_size:
+            return None
+        data = cached.get('data')
+        return data if isinstance(data, dict) else None
+
+    def _write_sidecar(self, st: os.stat_result, config: Dict[str, Any]) -> None:
+        """Atomically writes the parsed config next to the YAML file, if it survives a JSON round trip."""
+        try:
+            payload = json.dumps({'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'data': config})
+            if json.loads(payload)['data'] != config:
+                # YAML-only types (dates, non-string keys) would come back different; keep parsing YAML.
+                return
+        except (TypeError, ValueError):
+            return
+
+        cache_path = self.config_path + CONFIG_CACHE_SUFFIX
+        try:
+            _write_atomically(cache_path, payload.encode('utf-8'))
+        except OSError as e:
+            logger.debug("Could not write config cache '%s': %s", cache_path, e)
+
+    def _coerce_override(self, key: str, env_key: str, env_value: str) -> Any:
+        """Converts an override to the type of the value it replaces; unparsable numbers are ignored."""
+        current = self._flat[key] if key in self._flat else _DEFAULT_FLAT.get(key)
+        if isinstance(current, bool):
+            return env_value.strip().lower() in ('1', 'true', 'yes', 'on')
+        if isinstance(current, (int, float)):
             try:
-                for k in keys:
-                    default_value = default_value[k]
-                logger.debug(f"Config key '{key}' not found in file, returning default value from DEFAULT_CONFIG.")
-                return default_value
-            except (KeyError, TypeError):
-                logger.warning(
-                    f"Config key '{key}' not found in file or defaults, returning provided default: {default}.")
-                return default
\ No newline at end of file
+                return type(current)(env_value)
+            except ValueError:
+                logger.warning("Ignoring %s=%r: '%s' expects a %s.", env_key, env_value, key, type(current).__name__)
+                return current
+        return env_value
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        env_key = self._env_keys.get(key)
+        if env_key is not None:
+            env_value = os.environ.get(env_key)
+            if env_value is not None:
+                return self._coerce_override(key, env_key, env_value)
+        try:
+            return self._flat[key]
+        except KeyError:
+            pass
+        try:
+            default_value = _DEFAULT_FLAT[key]
+        except KeyError:
+            logger.warning("Config key '%s' not found in file or defaults, returning provided default: %s.", key, default)
+            return default
+        logger.debug("Config key '%s' not found in file, returning default value from DEFAULT_CONFIG.", key)
+        return default_value
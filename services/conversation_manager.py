@@ -3,13 +3,19 @@ Conversation Manager - Central hub for all conversational interactions
 Handles routing, context management, and conversation flow
 """
 import logging
-import json
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, List, Any, Optional, Pattern, Set, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from types import MappingProxyType
 
+from core import json_utils
 from core.models.messages import AuraMessage, MessageType
+from core.prompt_templates.compiled import CompiledPrompt
+from core.streaming_json import collect_json_text, collect_text
 from event_bus import EventBus
+from events import PlanReadyForReview
 
 
 class ConversationIntent(Enum):
@@ -24,6 +30,147 @@ class ConversationIntent(Enum):
     BUILD_REQUEST = "build_request"
 
 
+AGENT_STATUS_CHANGED = "agent_status_changed"
+
+_STATUS_MAP = MappingProxyType({
+    ConversationIntent.GREETING: ("Saying hello!", "fa5s.hand-wave"),
+    ConversationIntent.CASUAL_CHAT: ("Chatting...", "fa5s.comment-dots"),
+    ConversationIntent.PLANNING: ("Planning...", "fa5s.lightbulb"),
+    ConversationIntent.CODING: ("Coding...", "fa5s.code"),
+    ConversationIntent.ARCHITECTURE: ("Designing...", "fa5s.drafting-compass"),
+    ConversationIntent.DEBUGGING: ("Debugging...", "fa5s.bug"),
+    ConversationIntent.BUILD_REQUEST: ("Building...", "fa5s.hammer"),
+    ConversationIntent.CLARIFICATION: ("Thinking...", "fa5s.question-circle")
+})
+_DEFAULT_STATUS = ("Processing...", "fa5s.cog")
+
+# Fixed status lines posted by the handlers, prebuilt once as message prototypes.
+_CANNED_MESSAGES = MappingProxyType({
+    "chat_fallback": AuraMessage(MessageType.AGENT_RESPONSE, "I'm here to help! What would you like to work on?"),
+    "planning": AuraMessage(MessageType.AGENT_THOUGHT, "Let me think about this and create a comprehensive plan for you..."),
+    "coding": AuraMessage(MessageType.AGENT_THOUGHT, "I'll help you with that code. Let me work on it..."),
+    "debugging": AuraMessage(MessageType.AGENT_THOUGHT, "Let's debug this together. I'll analyze the issue..."),
+    "build": AuraMessage(MessageType.AGENT_RESPONSE, "Great! Let's build this together. I'll create a plan first..."),
+})
+
+_LEADING_BRACE = re.compile(r"\s*\{")
+
+_CHAT_PROMPT_TEMPLATE = CompiledPrompt("""You are Aura, an enthusiastic and helpful AI coding assistant. 
+You love discussing software development, sharing ideas, and helping developers.
+
+Your personality:
+- Friendly, encouraging, and supportive
+- Expert in software development but explain things clearly
+- Use analogies and examples to clarify concepts
+- Be concise but thorough
+- Show enthusiasm for coding and problem-solving
+
+Current conversation context:
+{history}  # Last 5 messages for context
+
+User says: {message}
+
+Respond naturally and helpfully. If they're asking about coding, be ready to help.
+If it's casual conversation, be friendly and engaging.""")
+
+_PLANNING_PROMPT_TEMPLATE = CompiledPrompt("""You are Aura, an expert software architect and planner.
+
+Create a comprehensive plan for the user's request.
+
+IMPORTANT: Respond with a JSON structure:
+{{
+    "thought": "Your analysis and reasoning about the request",
+    "plan": [
+        "Step 1: Clear, actionable task",
+        "Step 2: Another clear task",
+        ...
+    ]
+}}
+
+User request: {message}
+
+Context from conversation:
+{history}
+
+Create an efficient, practical plan that focuses on implementation.""")
+
+_ARCHITECTURE_PROMPT_TEMPLATE = CompiledPrompt("""You are Aura, an expert software architect.
+
+Discuss architecture, design patterns, and best practices.
+Be specific and practical, providing examples where helpful.
+
+User's architecture question: {message}
+
+Provide insights on:
+- Design patterns that apply
+- Architectural considerations
+- Best practices
+- Potential pitfalls to avoid
+- Scalability and maintainability
+
+Keep your response focused and actionable.""")
+
+_DEBUGGING_PROMPT_TEMPLATE = CompiledPrompt("""You are Aura, an expert debugger and problem solver.
+
+Help debug the issue described by the user.
+
+Current project files:
+{files_context}
+
+User's issue: {message}
+
+Provide:
+1. Likely cause of the issue
+2. Step-by-step debugging approach
+3. Potential solutions
+4. Code fixes if applicable
+
+Be systematic and thorough in your debugging approach.""")
+
+_CODE_PROMPT_TEMPLATE = CompiledPrompt("""You are Aura, an expert programmer.
+
+Generate clean, well-structured code for the user's request.
+Follow best practices and include helpful comments.
+
+User request: {message}
+
+Provide complete, working code that solves their problem.""")
+
+
+def _build_keyword_matcher(groups: Dict[str, Iterable[str]]) -> Tuple[Pattern, Dict[str, FrozenSet[str]]]:
+    """
+    Compiles every keyword into one overlapping-match pattern, so a message is
+    scanned once in C instead of once per keyword. Returns the pattern and a map
+    from each matched keyword to the groups it proves present (a keyword also
+    implies every shorter keyword it contains, e.g. "architecture" -> "architect").
+    """
+    groups_by_keyword = defaultdict(set)
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            groups_by_keyword[keyword].add(group)
+
+    keywords = sorted(groups_by_keyword, key=len, reverse=True)
+    implied_groups = {
+        keyword: frozenset().union(*(groups_by_keyword[other] for other in keywords if other in keyword))
+        for keyword in keywords
+    }
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    return pattern, implied_groups
+
+
+def _build_word_matcher(groups: Dict[str, Iterable[str]]) -> Pattern:
+    """
+    Compiles groups of word regexes into one whole-word pattern with a named
+    group per intent. Entries are regex fragments, so a group can spell out
+    the inflections it accepts (e.g. 'bugs?', 'debug\\w*').
+    """
+    alternatives = "|".join(
+        f"(?P<{group}>{'|'.join(sorted(words, key=len, reverse=True))})"
+        for group, words in groups.items()
+    )
+    return re.compile(rf"\b(?:{alternatives})\b")
+
+
 @dataclass
 class ConversationContext:
     """Maintains conversation state and context"""
@@ -48,21 +195,55 @@ class ConversationManager:
         self.context = ConversationContext()
         self.logger = logging.getLogger(__name__)
 
-        self.greeting_phrases = {
+        self.greeting_phrases = frozenset({
             "hi", "hello", "hey", "howdy", "greetings", "good morning",
             "good afternoon", "good evening", "sup", "what's up"
-        }
+        })
+        # Greetings are matched against the message's word unigrams and bigrams.
+        self._greet_1gram = frozenset(p for p in self.greeting_phrases if " " not in p)
+        self._greet_2gram = frozenset(p for p in self.greeting_phrases if " " in p)
 
-        self.coding_keywords = {
+        self.coding_keywords = frozenset({
             "code", "implement", "function", "class", "method", "api",
             "database", "frontend", "backend", "algorithm", "data structure"
-        }
+        })
 
-        self.planning_keywords = {
+        self.planning_keywords = frozenset({
             "plan", "design", "architect", "structure", "organize",
             "brainstorm", "ideas", "approach", "strategy"
+        })
+
+        # Topic keywords match anywhere (e.g. 'plan' in 'planning'); intent words match whole words and their inflections.
+        self._keyword_pattern, self._keyword_groups = _build_keyword_matcher({
+            "coding": self.coding_keywords,
+            "planning": self.planning_keywords,
+        })
+        self._word_pattern = _build_word_matcher({
+            "build_verb": (r"build\w*", r"creat\w*", r"mak\w*", r"develop\w*"),
+            "debugging": (r"debug\w*", r"errors?", r"bugs?", r"fix\w*", r"issues?"),
+            "architecture": ("architecture", "design pattern", "structure"),
+            "clarification": ("what", "how", "why", "when", "where"),
+        })
+
+        self._intent_dispatch = {
+            ConversationIntent.GREETING: self._handle_greeting,
+            ConversationIntent.CASUAL_CHAT: self._handle_casual_chat,
+            ConversationIntent.PLANNING: self._handle_planning_request,
+            ConversationIntent.CODING: self._handle_coding_request,
+            ConversationIntent.ARCHITECTURE: self._handle_architecture_discussion,
+            ConversationIntent.DEBUGGING: self._handle_debugging_request,
+            ConversationIntent.BUILD_REQUEST: self._handle_build_request,
         }
 
+    def _match_keyword_groups(self, message_lower: str) -> Set[str]:
+        """Returns the names of every keyword group that occurs in the message."""
+        keyword_groups = self._keyword_groups
+        found: Set[str] = set()
+        for match in self._keyword_pattern.finditer(message_lower):
+            found |= keyword_groups[match.group(1)]
+        found.update(match.lastgroup for match in self._word_pattern.finditer(message_lower))
+        return found
+
     async def process_message(self, message: str, conversation_history: List[Dict]) -> None:
         """
         Main entry point for processing user messages.
@@ -80,22 +261,8 @@ class ConversationManager:
 
         try:
             # Route based on intent
-            if intent == ConversationIntent.GREETING:
-                await self._handle_greeting(message)
-            elif intent == ConversationIntent.CASUAL_CHAT:
-                await self._handle_casual_chat(message, conversation_history)
-            elif intent == ConversationIntent.PLANNING:
-                await self._handle_planning_request(message, conversation_history)
-            elif intent == ConversationIntent.CODING:
-                await self._handle_coding_request(message, conversation_history)
-            elif intent == ConversationIntent.ARCHITECTURE:
-                await self._handle_architecture_discussion(message, conversation_history)
-            elif intent == ConversationIntent.DEBUGGING:
-                await self._handle_debugging_request(message, conversation_history)
-            elif intent == ConversationIntent.BUILD_REQUEST:
-                await self._handle_build_request(message, conversation_history)
-            else:
-                await self._handle_general_conversation(message, conversation_history)
+            handler = self._intent_dispatch.get(intent, self._handle_general_conversation)
+            await handler(message, conversation_history)
 
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
@@ -107,43 +274,47 @@ class ConversationManager:
         Uses both keyword matching and context awareness.
         """
         message_lower = message.lower().strip()
+        toks = message_lower.split()
+        grams1 = frozenset(toks)
+        grams2 = frozenset(f"{a} {b}" for a, b in zip(toks, toks[1:]))
 
         # Check for greetings
-        if any(greeting in message_lower.split() for greeting in self.greeting_phrases):
+        if self._greet_1gram & grams1 or self._greet_2gram & grams2:
             if self.context.conversation_depth == 0:
                 return ConversationIntent.GREETING
             else:
                 return ConversationIntent.CASUAL_CHAT
 
+        found = self._match_keyword_groups(message_lower)
+
         # Check for explicit build/create requests
-        if any(keyword in message_lower for keyword in ["build", "create", "make", "develop"]):
-            if any(keyword in message_lower for keyword in self.coding_keywords):
-                return ConversationIntent.BUILD_REQUEST
+        if "build_verb" in found and "coding" in found:
+            return ConversationIntent.BUILD_REQUEST
 
         # Check for planning requests
-        if any(keyword in message_lower for keyword in self.planning_keywords):
+        if "planning" in found:
             return ConversationIntent.PLANNING
 
         # Check for coding-related content
-        if any(keyword in message_lower for keyword in self.coding_keywords):
+        if "coding" in found:
             return ConversationIntent.CODING
 
         # Check for debugging
-        if any(keyword in message_lower for keyword in ["debug", "error", "bug", "fix", "issue"]):
+        if "debugging" in found:
             return ConversationIntent.DEBUGGING
 
         # Check for architecture discussions
-        if any(keyword in message_lower for keyword in ["architecture", "design pattern", "structure"]):
+        if "architecture" in found:
             return ConversationIntent.ARCHITECTURE
 
         # Check for questions or clarifications
-        if "?" in message or any(word in message_lower for word in ["what", "how", "why", "when", "where"]):
+        if "?" in message or "clarification" in found:
             return ConversationIntent.CLARIFICATION
 
         # Default to casual chat
         return ConversationIntent.CASUAL_CHAT
 
-    async def _handle_greeting(self, _message: str) -> None:
+    async def _handle_greeting(self, _message: str, _history: Optional[List[Dict]] = None) -> None:
         """Handles initial greetings with a warm, helpful response"""
         response = (
             "Hey there! 👋 I'm Aura, your AI coding companion! I'm here to help you design, "
@@ -168,16 +339,13 @@ class ConversationManager:
         prompt = self._build_chat_prompt(message, history)
 
         try:
-            response_text = ""
             stream = self.llm_client.stream_chat(provider, model, prompt, "chat", history=history)
+            response_text = await collect_text(stream)
 
-            async for chunk in stream:
-                response_text += chunk
-
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 self._post_message(response_text, MessageType.AGENT_RESPONSE)
             else:
-                self._post_message("I'm here to help! What would you like to work on?", MessageType.AGENT_RESPONSE)
+                self._post_canned("chat_fallback")
 
         except Exception as e:
             self.logger.error(f"Chat error: {e}")
@@ -190,20 +358,20 @@ class ConversationManager:
             self._post_error("Planning model not configured. Please configure models first.")
             return
 
-        self._post_message("Let me think about this and create a comprehensive plan for you...",
-                           MessageType.AGENT_THOUGHT)
+        self._post_canned("planning")
+        await self._plan_core(message, history, provider, model)
 
+    async def _plan_core(self, message: str, history: List[Dict], provider: str, model: str) -> None:
+        """Runs the planner model and processes its response"""
         prompt = self._build_planning_prompt(message, history)
 
         try:
             stream = self.llm_client.stream_chat(provider, model, prompt, "planner", history=history)
-            response_text = ""
-
-            async for chunk in stream:
-                response_text += chunk
+            # Plans are a single JSON object; stop reading once it closes
+            response_text = await collect_json_text(stream, leading_only=True)
 
             # Parse and handle the planning response
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 await self._process_planning_response(response_text)
             else:
                 self._post_error("I couldn't generate a proper plan. Could you provide more details?")
@@ -214,11 +382,15 @@ class ConversationManager:
 
     async def _handle_coding_request(self, message: str, history: List[Dict]) -> None:
         """Handles direct coding requests"""
-        self._post_message("I'll help you with that code. Let me work on it...", MessageType.AGENT_THOUGHT)
+        self._post_canned("coding")
 
         # Determine if we need to plan first or can code directly
         if self._needs_planning(message):
-            await self._handle_planning_request(message, history)
+            provider, model = self.llm_client.get_model_for_role("planner")
+            if not provider or not model:
+                self._post_error("Planning model not configured. Please configure models first.")
+                return
+            await self._plan_core(message, history, provider, model)
         else:
             await self._generate_code_response(message, history)
 
@@ -237,12 +409,9 @@ class ConversationManager:
 
         try:
             stream = self.llm_client.stream_chat(provider, model, prompt, "architect", history=history)
-            response_text = ""
-
-            async for chunk in stream:
-                response_text += chunk
+            response_text = await collect_text(stream)
 
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 self._post_message(response_text, MessageType.AGENT_RESPONSE)
 
         except Exception as e:
@@ -251,26 +420,23 @@ class ConversationManager:
 
     async def _handle_debugging_request(self, message: str, history: List[Dict]) -> None:
         """Handles debugging and troubleshooting requests"""
-        self._post_message("Let's debug this together. I'll analyze the issue...", MessageType.AGENT_THOUGHT)
-
-        # Get current project context if available
-        project_files = self.project_manager.get_project_files() if self.project_manager else {}
-
-        prompt = self._build_debugging_prompt(message, history, project_files)
+        self._post_canned("debugging")
 
         provider, model = self.llm_client.get_model_for_role("chat")
         if not provider or not model:
             self._post_error("Debugging model not configured.")
             return
 
+        # Only the file names are needed, so the contents are never read
+        project_files = list(self.project_manager.iter_project_file_paths()) if self.project_manager else []
+
+        prompt = self._build_debugging_prompt(message, history, project_files)
+
         try:
             stream = self.llm_client.stream_chat(provider, model, prompt, "chat", history=history)
-            response_text = ""
+            response_text = await collect_text(stream)
 
-            async for chunk in stream:
-                response_text += chunk
-
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 self._post_message(response_text, MessageType.AGENT_RESPONSE)
 
         except Exception as e:
@@ -279,7 +445,7 @@ class ConversationManager:
 
     async def _handle_build_request(self, message: str, history: List[Dict]) -> None:
         """Handles explicit build/create requests"""
-        self._post_message("Great! Let's build this together. I'll create a plan first...", MessageType.AGENT_RESPONSE)
+        self._post_canned("build")
         await self._handle_planning_request(message, history)
 
     async def _handle_general_conversation(self, message: str, history: List[Dict]) -> None:
@@ -288,87 +454,23 @@ class ConversationManager:
 
     def _build_chat_prompt(self, message: str, history: List[Dict]) -> str:
         """Builds a conversational prompt for chat interactions"""
-        return f"""You are Aura, an enthusiastic and helpful AI coding assistant. 
-You love discussing software development, sharing ideas, and helping developers.
-
-Your personality:
-- Friendly, encouraging, and supportive
-- Expert in software development but explain things clearly
-- Use analogies and examples to clarify concepts
-- Be concise but thorough
-- Show enthusiasm for coding and problem-solving
-
-Current conversation context:
-{self._format_history(history[-5:])}  # Last 5 messages for context
-
-User says: {message}
-
-Respond naturally and helpfully. If they're asking about coding, be ready to help.
-If it's casual conversation, be friendly and engaging."""
+        return _CHAT_PROMPT_TEMPLATE.render(history=self._format_history(history[-5:]), message=message)
 
     def _build_planning_prompt(self, message: str, history: List[Dict]) -> str:
         """Builds a prompt for planning responses"""
-        return f"""You are Aura, an expert software architect and planner.
-
-Create a comprehensive plan for the user's request.
-
-IMPORTANT: Respond with a JSON structure:
-{{
-    "thought": "Your analysis and reasoning about the request",
-    "plan": [
-        "Step 1: Clear, actionable task",
-        "Step 2: Another clear task",
-        ...
-    ]
-}}
-
-User request: {message}
-
-Context from conversation:
-{self._format_history(history[-3:])}
-
-Create an efficient, practical plan that focuses on implementation."""
+        return _PLANNING_PROMPT_TEMPLATE.render(message=message, history=self._format_history(history[-3:]))
 
     @staticmethod
     def _build_architecture_prompt(message: str, _history: List[Dict]) -> str:
         """Builds a prompt for architecture discussions"""
-        return f"""You are Aura, an expert software architect.
-
-Discuss architecture, design patterns, and best practices.
-Be specific and practical, providing examples where helpful.
-
-User's architecture question: {message}
-
-Provide insights on:
-- Design patterns that apply
-- Architectural considerations
-- Best practices
-- Potential pitfalls to avoid
-- Scalability and maintainability
-
-Keep your response focused and actionable."""
+        return _ARCHITECTURE_PROMPT_TEMPLATE.render(message=message)
 
     @staticmethod
-    def _build_debugging_prompt(message: str, _history: List[Dict], project_files: Dict) -> str:
+    def _build_debugging_prompt(message: str, _history: List[Dict], project_files: Iterable[str]) -> str:
         """Builds a prompt for debugging assistance"""
-        files_context = "\n".join(project_files.keys()) if project_files else "No files in project yet"
-
-        return f"""You are Aura, an expert debugger and problem solver.
-
-Help debug the issue described by the user.
-
-Current project files:
-{files_context}
+        files_context = "\n".join(project_files) or "No files in project yet"
 
-User's issue: {message}
-
-Provide:
-1. Likely cause of the issue
-2. Step-by-step debugging approach
-3. Potential solutions
-4. Code fixes if applicable
-
-Be systematic and thorough in your debugging approach."""
+        return _DEBUGGING_PROMPT_TEMPLATE.render(files_context=files_context, message=message)
 
     async def _generate_code_response(self, message: str, history: List[Dict]) -> None:
         """Generates actual code in response to coding requests"""
@@ -380,23 +482,13 @@ Be systematic and thorough in your debugging approach."""
             self._post_error("Coding model not configured.")
             return
 
-        prompt = f"""You are Aura, an expert programmer.
-
-Generate clean, well-structured code for the user's request.
-Follow best practices and include helpful comments.
-
-User request: {message}
-
-Provide complete, working code that solves their problem."""
+        prompt = _CODE_PROMPT_TEMPLATE.render(message=message)
 
         try:
             stream = self.llm_client.stream_chat(provider, model, prompt, "coder", history=history)
-            response_text = ""
-
-            async for chunk in stream:
-                response_text += chunk
+            response_text = await collect_text(stream)
 
-            if response_text.strip():
+            if response_text and not response_text.isspace():
                 self._post_message(response_text, MessageType.AGENT_RESPONSE)
 
         except Exception as e:
@@ -405,38 +497,36 @@ Provide complete, working code that solves their problem."""
 
     async def _process_planning_response(self, response_text: str) -> None:
         """Processes and formats planning responses"""
-        try:
-            # Try to parse as JSON first
-            if response_text.strip().startswith('{'):
-                data = json.loads(response_text)
-
-                if "thought" in data:
-                    self._post_message(data["thought"], MessageType.AGENT_THOUGHT)
-
-                if "plan" in data and data["plan"]:
-                    # Add tasks to mission log
-                    from events import PlanReadyForReview
-
-                    for task in data["plan"]:
-                        # Emit event to add task to
-                        self.event_bus.emit("add_mission_task", task)
-
-                    self._post_message(
-                        f"I've created a comprehensive plan with {len(data['plan'])} steps. "
-                        "Check the Agent TODO list to review and execute the tasks!",
-                        MessageType.AGENT_RESPONSE
-                    )
-                    self.event_bus.emit("plan_ready_for_review", PlanReadyForReview())
-                else:
-                    # No plan in response, treat as regular response
-                    self._post_message(response_text, MessageType.AGENT_RESPONSE)
-            else:
-                # Not JSON, treat as regular response
-                self._post_message(response_text, MessageType.AGENT_RESPONSE)
+        # Only responses that open with a JSON object are parsed as plans
+        if not _LEADING_BRACE.match(response_text):
+            self._post_message(response_text, MessageType.AGENT_RESPONSE)
+            return
 
-        except json.JSONDecodeError:
+        try:
+            data = json_utils.loads(response_text)
+        except json_utils.JSONDecodeError:
             # If not valid JSON, just post as regular response
             self._post_message(response_text, MessageType.AGENT_RESPONSE)
+            return
+
+        if "thought" in data:
+            self._post_message(data["thought"], MessageType.AGENT_THOUGHT)
+
+        plan = data.get("plan") or ()
+        if plan:
+            # Hand the whole plan to the mission log in one event
+            plan = list(plan)
+            self.event_bus.emit("add_mission_tasks_batch", plan)
+
+            self._post_message(
+                f"I've created a comprehensive plan with {len(plan)} steps. "
+                "Check the Agent TODO list to review and execute the tasks!",
+                MessageType.AGENT_RESPONSE
+            )
+            self.event_bus.emit("plan_ready_for_review", PlanReadyForReview())
+        else:
+            # No plan in response, treat as regular response
+            self._post_message(response_text, MessageType.AGENT_RESPONSE)
 
     @staticmethod
     def _needs_planning(message: str) -> bool:
@@ -453,36 +543,27 @@ Provide complete, working code that solves their problem."""
         if not history:
             return "No previous conversation"
 
-        formatted = []
-        for msg in history:
-            role = "User" if msg.get("role") == "user" else "Aura"
-            content = msg.get("content", "")[:200]  # Truncate long messages
-            formatted.append(f"{role}: {content}")
-
-        return "\n".join(formatted)
+        # Truncate long messages
+        return "\n".join(
+            f"{'User' if msg.get('role') == 'user' else 'Aura'}: {msg.get('content', '')[:200]}"
+            for msg in history
+        )
 
     def _update_agent_status(self, intent: ConversationIntent) -> None:
         """Updates agent status based on intent"""
-        status_map = {
-            ConversationIntent.GREETING: ("Saying hello!", "fa5s.hand-wave"),
-            ConversationIntent.CASUAL_CHAT: ("Chatting...", "fa5s.comment-dots"),
-            ConversationIntent.PLANNING: ("Planning...", "fa5s.lightbulb"),
-            ConversationIntent.CODING: ("Coding...", "fa5s.code"),
-            ConversationIntent.ARCHITECTURE: ("Designing...", "fa5s.drafting-compass"),
-            ConversationIntent.DEBUGGING: ("Debugging...", "fa5s.bug"),
-            ConversationIntent.BUILD_REQUEST: ("Building...", "fa5s.hammer"),
-            ConversationIntent.CLARIFICATION: ("Thinking...", "fa5s.question-circle")
-        }
-
-        status, icon = status_map.get(intent, ("Processing...", "fa5s.cog"))
-        self.event_bus.emit("agent_status_changed", "Aura", status, icon)
+        status, icon = _STATUS_MAP.get(intent, _DEFAULT_STATUS)
+        self.event_bus.emit(AGENT_STATUS_CHANGED, "Aura", status, icon)
 
     def _post_message(self, content: str, msg_type: MessageType) -> None:
         """Posts a message to the UI"""
         message = AuraMessage(type=msg_type, content=content)
         self.event_bus.emit("post_structured_message", message)
 
+    def _post_canned(self, key: str) -> None:
+        """Posts a fixed status message, stamped with the current time"""
+        self.event_bus.emit("post_structured_message", replace(_CANNED_MESSAGES[key], timestamp=None))
+
     def _post_error(self, error_msg: str) -> None:
         """Posts an error message"""
         self._post_message(error_msg, MessageType.ERROR)
-        self.event_bus.emit("agent_status_changed", "Aura", "Error", "fa5s.exclamation-triangle")
\ No newline at end of file
+        self.event_bus.emit(AGENT_STATUS_CHANGED, "Aura", "Error", "fa5s.exclamation-triangle")
\ No newline at end of file
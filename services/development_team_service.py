@@ -1,11 +1,15 @@
 # services/development_team_service.py
 from __future__ import annotations
-import json
+import asyncio
 import re
 import traceback
+from functools import cached_property
 from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
 from event_bus import EventBus
+from core import json_utils
+from core.history_formatter import HistoryFormatter
+from core.llm_cache import LLMResponseCache
 from core.prompt_templates.architect import ArchitectPrompt
 from core.prompt_templates.coder import CoderPrompt
 from core.prompt_templates.replan import RePlannerPrompt
@@ -15,11 +19,36 @@ from core.prompt_templates.dispatcher import ChiefOfStaffDispatcherPrompt
 from events import PlanReadyForReview, MissionDispatchRequest, PostChatMessage
 from services.agent_workflow_manager import AgentWorkflowManager
 from core.stream_parser import parse_llm_stream_async
+from core.streaming_json import collect_json_text, collect_text, extract_first_json_object
 from core.models.messages import AuraMessage, MessageType
 
 if TYPE_CHECKING:
     from core.managers.service_manager import ServiceManager
 
+# The dispatcher's routing decision inside its small JSON reply.
+_DISPATCH_TO_RE = re.compile(r'\{[^}]*"dispatch_to"\s*:\s*"([^"]*)"[^}]*\}')
+
+# Explicit requests to run the existing plan, matched after trimming trailing punctuation.
+_BUILD_COMMANDS = frozenset({
+    "build it", "let's build it", "lets build it", "let's build", "start the build",
+    "run the plan", "execute the plan", "dispatch aura", "go ahead and build it"
+})
+
+# Display names for tool ids, e.g. 'stream_and_write_file' -> 'Stream And Write File'.
+_SUMMARY_CACHE: Dict[str, str] = {}
+# Argument shown after the tool name in a task summary, first present key wins.
+_SUMMARY_ARG_KEYS = ("dependency", "path", "source_path", "project_name")
+
+# Greetings that mark a message as chat, alone or followed by more words.
+_CHAT_INDICATORS = frozenset({
+    "hi", "hello", "hey", "howdy", "greetings", "good morning",
+    "good afternoon", "good evening", "sup", "what's up", "yo",
+    "how are you", "how's it going", "what's happening"
+})
+_CHAT_PREFIXES = tuple(f"{indicator} " for indicator in _CHAT_INDICATORS)
+# Words that signal a request for work rather than conversation.
+_ACTION_KEYWORDS = ("build", "create", "make", "code", "implement", "fix", "debug", "plan")
+
 
 class DevelopmentTeamService:
     """
@@ -36,30 +65,84 @@ class DevelopmentTeamService:
         self.vector_context_service = service_manager.vector_context_service
         self.foundry_manager = service_manager.get_foundry_manager()
         self.tool_runner_service = service_manager.tool_runner_service
-        self.workflow_manager = AgentWorkflowManager(
+        self.history_formatter = HistoryFormatter()
+        # Prompt templates are stateless apart from their rendered-prefix caches, so one of each serves every call
+        self._dispatcher_prompt = ChiefOfStaffDispatcherPrompt()
+        self._architect_prompt = ArchitectPrompt()
+        self._coder_prompt = CoderPrompt()
+        self._replanner_prompt = RePlannerPrompt()
+        self._summarizer_prompt = MissionSummarizerPrompt()
+        self._speculative_planning = bool(
+            service_manager.config_manager.get("workflow.speculative_planning", False))
+        # Last status shown by any agent; tracked from the bus so emits from other services count too
+        self._last_status: Optional[tuple] = None
+        self.event_bus.subscribe("agent_status_changed", self._remember_status)
+
+    @cached_property
+    def workflow_manager(self) -> AgentWorkflowManager:
+        """Built on first use, so sessions that never run a workflow skip it."""
+        return AgentWorkflowManager(
             llm_client=self.llm_client,
             event_bus=self.event_bus,
             mission_log_service=self.mission_log_service,
             project_manager=self.project_manager,
-            foundry_manager=self.foundry_manager
+            foundry_manager=self.foundry_manager,
+            history_formatter=self.history_formatter
         )
 
+    @cached_property
+    def response_cache(self) -> LLMResponseCache:
+        """The ServiceManager's shared cache, looked up on the first cacheable LLM call."""
+        return self.service_manager.get_llm_response_cache()
+
+    async def _cached_collect(self, role: str, provider: str, model: str, prompt: str,
+                              json_only: bool = True, leading_only: bool = False,
+                              bypass_cache: bool = False) -> str:
+        """
+        Returns the model response, reusing a cached one for an identical prompt.
+        json_only stops reading at the end of the first JSON object (see
+        collect_json_text for leading_only); bypass_cache always asks the model,
+        but still stores the fresh answer.
+        """
+        temperature = self.llm_client.get_role_temperature(role)
+        key = self.response_cache.make_key(role, provider, model, temperature, prompt)
+        if not bypass_cache:
+            cached = self.response_cache.get(key)
+            if cached is not None:
+                self.log("info", f"Reusing cached '{role}' response.")
+                return cached
+        stream = self.llm_client.stream_chat(provider, model, prompt, role)
+        if json_only:
+            response_str = await collect_json_text(stream, leading_only=leading_only)
+        else:
+            response_str = await collect_text(stream)
+        self.response_cache.put(key, response_str)
+        return response_str
+
     def _post_chat_message(self, sender: str, message: str, is_error: bool = False):
-        if message and message.strip():
+        if message and not message.isspace():
             self.event_bus.emit("post_chat_message", PostChatMessage(sender, message, is_error))
 
     def _post_structured_message(self, message: AuraMessage):
         """Post a structured message to the command deck"""
-        if message.content and message.content.strip():
+        if message.content and not message.content.isspace():
             self.event_bus.emit("post_structured_message", message)
 
     def handle_error(self, agent: str, error_msg: str):
         """Handle and display errors properly"""
         print(f"[DevelopmentTeamService] ERROR: {agent} - {error_msg}")
         self.log("error", f"{agent} failed: {error_msg}")
-        self.event_bus.emit("agent_status_changed", "Aura", "Failed", "fa5s.exclamation-triangle")
+        self._set_status("Aura", "Failed", "fa5s.exclamation-triangle")
         self._post_structured_message(AuraMessage.error(error_msg))
 
+    def _remember_status(self, agent: str, status: str, icon: str):
+        self._last_status = (agent, status, icon)
+
+    def _set_status(self, agent: str, status: str, icon: str):
+        """Emits an agent status change unless that exact status is already showing"""
+        if (agent, status, icon) != self._last_status:
+            self.event_bus.emit("agent_status_changed", agent, status, icon)
+
     def log(self, level: str, message: str):
         """Log messages to the event bus"""
         print(f"[DevelopmentTeamService] {level.upper()}: {message}")
@@ -69,32 +152,47 @@ class DevelopmentTeamService:
         """
         Determines if the user input is clearly a chat/greeting request.
         """
-        chat_indicators = [
-            "hi", "hello", "hey", "howdy", "greetings", "good morning",
-            "good afternoon", "good evening", "sup", "what's up", "yo",
-            "how are you", "how's it going", "what's happening"
-        ]
-
         user_input_lower = user_idea.lower().strip()
 
         # Check for exact matches or starts with greeting
-        for indicator in chat_indicators:
-            if user_input_lower == indicator or user_input_lower.startswith(indicator + " "):
-                return True
+        if user_input_lower in _CHAT_INDICATORS or user_input_lower.startswith(_CHAT_PREFIXES):
+            return True
 
         # Check if it's a very short message without clear intent
-        if len(user_input_lower.split()) <= 3 and not any(
-                keyword in user_input_lower for keyword in
-                ["build", "create", "make", "code", "implement", "fix", "debug", "plan"]
-        ):
+        if len(user_input_lower.split()) <= 3 and not any(keyword in user_input_lower for keyword in _ACTION_KEYWORDS):
             return True
 
         return False
 
+    @staticmethod
+    def _route_locally(user_idea: str, has_tasks: bool) -> Optional[str]:
+        """
+        Picks a dispatch target without the LLM when the request is unambiguous,
+        returning None when the dispatcher model should decide.
+        """
+        command = user_idea.lower().strip().rstrip(".!")
+        if has_tasks and command in _BUILD_COMMANDS:
+            return "CONDUCTOR"
+        return None
+
+    @staticmethod
+    def _summarize_tool_call(tool_call: Dict[str, Any]) -> str:
+        """Builds a short, human-readable task description for a planned tool call."""
+        tool_name = tool_call.get('tool_name') or 'unknown_tool'
+        base = _SUMMARY_CACHE.get(tool_name)
+        if base is None:
+            base = _SUMMARY_CACHE[tool_name] = tool_name.replace('_', ' ').title()
+
+        arguments = tool_call.get('arguments')
+        if not isinstance(arguments, dict):
+            return base
+        detail = next((arguments[key] for key in _SUMMARY_ARG_KEYS if arguments.get(key)), None)
+        return f"{base}: {detail}" if detail else base
+
     def _parse_json_response(self, response: str) -> dict:
-        match = re.search(r'\{.*?\}', response, re.DOTALL)
-        if match:
-            return json.loads(match.group(0))
+        json_text = extract_first_json_object(response)
+        if json_text:
+            return json_utils.loads(json_text)
         return {}
 
     async def handle_user_prompt(self, user_idea: str, conversation_history: List[Dict]) -> None:
@@ -118,7 +216,15 @@ class DevelopmentTeamService:
             current_tasks = self.mission_log_service.get_tasks()
             print(f"[DevelopmentTeamService] Found {len(current_tasks)} existing tasks")
 
-            # First, check if this is clearly a chat request (greetings, etc.)
+            # Explicit build commands need no LLM to interpret. Checked before the chat
+            # heuristic, which would otherwise take short commands like "dispatch aura".
+            local_route = self._route_locally(user_idea, bool(current_tasks))
+            if local_route:
+                print(f"[DevelopmentTeamService] Routed locally to {local_route}")
+                await self._dispatch(local_route, user_idea, conversation_history)
+                return
+
+            # Next, check if this is clearly a chat request (greetings, etc.)
             if self._is_chat_request(user_idea):
                 print("[DevelopmentTeamService] Detected chat request, using general chat workflow...")
                 await self.workflow_manager.run_workflow("GENERAL_CHAT", user_idea, conversation_history)
@@ -143,15 +249,16 @@ class DevelopmentTeamService:
         Uses the dispatcher to route to the appropriate workflow.
         Fixed to better handle simple messages.
         """
+        planning_task: Optional[asyncio.Task] = None
         try:
             print("[DevelopmentTeamService] Starting dispatcher workflow...")
             self.log("info", "Chief of Staff analyzing user intent...")
-            self.event_bus.emit("agent_status_changed", "Chief of Staff", "Analyzing request...", "fa5s.user-tie")
+            self._set_status("Chief of Staff", "Analyzing request...", "fa5s.user-tie")
 
-            conv_history_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in conversation_history])
+            conv_history_str = self.history_formatter.format(conversation_history)
             mission_log_summary = self.mission_log_service.get_log_as_string_summary()
 
-            prompt_template = ChiefOfStaffDispatcherPrompt()
+            prompt_template = self._dispatcher_prompt
             prompt = prompt_template.render(
                 user_prompt=user_idea,
                 conversation_history=conv_history_str,
@@ -169,14 +276,13 @@ class DevelopmentTeamService:
 
             self.event_bus.emit("processing_started")
 
-            # Collect raw response for debugging
-            raw_response_chunks = []
-            stream_chunks = self.llm_client.stream_chat(provider, model, prompt, "dispatcher")
-
-            async for chunk in stream_chunks:
-                raw_response_chunks.append(chunk)
+            # Most non-chat requests end up planned, so the plan is drafted while the dispatcher decides
+            if self._speculative_planning:
+                planning_task = self._start_speculative_planning(user_idea, conversation_history)
 
-            full_response = "".join(raw_response_chunks)
+            # The decision is a small JSON object, so stop reading once it closes
+            stream_chunks = self.llm_client.stream_chat(provider, model, prompt, "dispatcher")
+            full_response = await collect_json_text(stream_chunks)
             print(f"[DevelopmentTeamService] Dispatcher raw response: {full_response[:200]}...")
 
             # Try to parse dispatcher decision with better fallback
@@ -184,7 +290,7 @@ class DevelopmentTeamService:
             try:
                 # Look for JSON in the response
                 if '{' in full_response:
-                    match = re.search(r'\{[^}]*"dispatch_to"\s*:\s*"([^"]*)"[^}]*\}', full_response)
+                    match = _DISPATCH_TO_RE.search(full_response)
                     if match:
                         dispatch_to = match.group(1)
                         print(f"[DevelopmentTeamService] Dispatcher decision: {dispatch_to}")
@@ -203,21 +309,11 @@ class DevelopmentTeamService:
 
                 print(f"[DevelopmentTeamService] Using fallback dispatch: {dispatch_to}")
 
-            # Execute the dispatch decision
-            if dispatch_to == "CONDUCTOR":
-                self.log("info", "User requested to start the build. Dispatching to Conductor.")
-                self._post_chat_message("Aura", "Okay, I'll start the build process now.")
-                self.event_bus.emit("mission_dispatch_requested", MissionDispatchRequest())
-            elif dispatch_to == "CREATIVE_ASSISTANT":
-                await self._run_direct_planning_workflow(user_idea, conversation_history)
-            elif dispatch_to == "GENERAL_CHAT":
-                await self.workflow_manager.run_workflow("GENERAL_CHAT", user_idea, conversation_history)
-            elif dispatch_to:
-                await self.workflow_manager.run_workflow(dispatch_to, user_idea, conversation_history)
+            if dispatch_to == "CREATIVE_ASSISTANT" and planning_task is not None:
+                speculative, planning_task = planning_task, None
+                await self._run_direct_planning_workflow(user_idea, conversation_history, speculative)
             else:
-                # Final fallback - default to chat
-                self.log("info", "Dispatcher returned unclear target. Defaulting to chat.")
-                await self.workflow_manager.run_workflow("GENERAL_CHAT", user_idea, conversation_history)
+                await self._dispatch(dispatch_to, user_idea, conversation_history)
 
         except Exception as e:
             print(f"[DevelopmentTeamService] EXCEPTION in _run_dispatcher_workflow: {e}")
@@ -225,17 +321,52 @@ class DevelopmentTeamService:
             self.log("warning", f"Dispatcher workflow failed: {e}. Falling back to chat.")
             await self.workflow_manager.run_workflow("GENERAL_CHAT", user_idea, conversation_history)
         finally:
+            # Cancelling unwinds collect_json_text, which acloses the planner stream
+            if planning_task is not None and not planning_task.cancel():
+                # Already finished; fetch any error so it is not reported as never retrieved
+                planning_task.exception()
             self.event_bus.emit("processing_finished")
 
-    async def _run_direct_planning_workflow(self, user_idea: str, conversation_history: list):
+    async def _dispatch(self, dispatch_to: Optional[str], user_idea: str, conversation_history: list):
+        """Runs the workflow selected for the user's request."""
+        if dispatch_to == "CONDUCTOR":
+            self.log("info", "User requested to start the build. Dispatching to Conductor.")
+            self._post_chat_message("Aura", "Okay, I'll start the build process now.")
+            self.event_bus.emit("mission_dispatch_requested", MissionDispatchRequest())
+        elif dispatch_to == "CREATIVE_ASSISTANT":
+            await self._run_direct_planning_workflow(user_idea, conversation_history)
+        elif dispatch_to == "GENERAL_CHAT":
+            await self.workflow_manager.run_workflow("GENERAL_CHAT", user_idea, conversation_history)
+        elif dispatch_to:
+            await self.workflow_manager.run_workflow(dispatch_to, user_idea, conversation_history)
+        else:
+            # Final fallback - default to chat
+            self.log("info", "Dispatcher returned unclear target. Defaulting to chat.")
+            await self.workflow_manager.run_workflow("GENERAL_CHAT", user_idea, conversation_history)
+
+    def _render_planner_prompt(self, user_idea: str, conversation_history: list) -> str:
+        conv_history_str = self.history_formatter.format(conversation_history)
+        return self._architect_prompt.render(user_idea=user_idea, conversation_history=conv_history_str)
+
+    def _start_speculative_planning(self, user_idea: str, conversation_history: list) -> Optional[asyncio.Task]:
+        """Starts the planner call in the background; the caller cancels it if planning is not chosen."""
+        provider, model = self.llm_client.get_model_for_role("planner")
+        if not provider or not model:
+            return None
+        prompt = self._render_planner_prompt(user_idea, conversation_history)
+        return asyncio.create_task(self._cached_collect("planner", provider, model, prompt, leading_only=True))
+
+    async def _run_direct_planning_workflow(self, user_idea: str, conversation_history: list,
+                                            planning_task: Optional[asyncio.Task] = None):
         """
         Direct planning workflow that creates a plan and populates the mission log.
         This bypasses the dispatcher and goes straight to plan generation.
+        A planning_task already started by the dispatcher supplies the response.
         """
         try:
             print("[DevelopmentTeamService] Starting direct planning workflow...")
             self.log("info", f"Direct planning workflow initiated for: '{user_idea[:50]}...'")
-            self.event_bus.emit("agent_status_changed", "Aura", "Formulating an efficient plan...", "fa5s.lightbulb")
+            self._set_status("Aura", "Formulating an efficient plan...", "fa5s.lightbulb")
 
             print("[DevelopmentTeamService] Getting model for planner role...")
             provider, model = self.llm_client.get_model_for_role("planner")
@@ -246,31 +377,27 @@ class DevelopmentTeamService:
                                   "No 'planner' model configured. Please configure AI models first using the 'Configure Model' button.")
                 return
 
-            print("[DevelopmentTeamService] Creating prompt...")
-            prompt_template = ArchitectPrompt()
-            conv_history_str = "\n".join([f"{msg['role']}: {msg['content']}" for msg in conversation_history])
-            prompt = prompt_template.render(user_idea=user_idea, conversation_history=conv_history_str)
-
-            print(f"[DevelopmentTeamService] Prompt preview: {prompt[:200]}...")
-
-            print("[DevelopmentTeamService] Starting LLM stream...")
             self.event_bus.emit("processing_started")
 
-            # Collect raw response
-            raw_response_chunks = []
-            stream_chunks = self.llm_client.stream_chat(provider, model, prompt, "planner")
-
-            async for chunk in stream_chunks:
-                raw_response_chunks.append(chunk)
-
-            full_raw_response = "".join(raw_response_chunks)
+            if planning_task is not None:
+                print("[DevelopmentTeamService] Awaiting speculatively started plan...")
+                full_raw_response = await planning_task
+            else:
+                print("[DevelopmentTeamService] Creating prompt...")
+                prompt = self._render_planner_prompt(user_idea, conversation_history)
+                print(f"[DevelopmentTeamService] Prompt preview: {prompt[:200]}...")
+
+                print("[DevelopmentTeamService] Starting LLM stream...")
+                # A plan reply is one JSON object, so stop reading once it closes
+                full_raw_response = await self._cached_collect("planner", provider, model, prompt,
+                                                               leading_only=True)
             print(f"[DevelopmentTeamService] Planning response: {full_raw_response[:200]}...")
 
             # Parse the response
-            if full_raw_response.strip():
+            if full_raw_response and not full_raw_response.isspace():
                 if full_raw_response.strip().startswith('{'):
                     try:
-                        response_data = json.loads(full_raw_response)
+                        response_data = json_utils.loads(full_raw_response)
                         print(f"[DevelopmentTeamService] Successfully parsed JSON: {list(response_data.keys())}")
 
                         # Handle thought if present
@@ -282,8 +409,11 @@ class DevelopmentTeamService:
                         plan_steps = response_data.get("plan", [])
                         print(f"[DevelopmentTeamService] Found {len(plan_steps)} plan steps")
                         if plan_steps:
-                            for step in plan_steps:
-                                self.mission_log_service.add_task(step)
+                            # The architect plans in tool calls; keep each call and describe it.
+                            self.mission_log_service.add_tasks(
+                                (self._summarize_tool_call(step), step) if isinstance(step, dict) else (step, None)
+                                for step in plan_steps
+                            )
                             self._post_chat_message("Aura",
                                                     "I've created a comprehensive plan for your project. Check the 'Agent TODO' list to review the tasks.")
                             self.event_bus.emit("plan_ready_for_review", PlanReadyForReview())
@@ -296,7 +426,7 @@ class DevelopmentTeamService:
                             else:
                                 self.handle_error("Aura", "Failed to generate a valid plan - no tasks found.")
 
-                    except (ValueError, json.JSONDecodeError) as e:
+                    except (ValueError, json_utils.JSONDecodeError) as e:
                         print(f"[DevelopmentTeamService] JSON parsing error: {e}")
                         self._post_structured_message(AuraMessage.agent_response(full_raw_response))
                 else:
@@ -313,34 +443,77 @@ class DevelopmentTeamService:
         finally:
             self.event_bus.emit("processing_finished")
 
+    @staticmethod
+    def _build_snippet_context(retrieved_chunks: List[Dict[str, Any]]) -> str:
+        """Renders retrieved chunks as fenced snippets, appending raw segments and joining once."""
+        parts = ["Here are the most relevant code snippets based on the task:\n"]
+        append = parts.append
+        for chunk in retrieved_chunks:
+            metadata = chunk['metadata']
+            append("\n\n```python\n# From file: ")
+            append(metadata.get('file_path', 'N/A'))
+            append(" (")
+            append(metadata.get('node_type', 'N/A'))
+            append(": ")
+            append(metadata.get('node_name', 'N/A'))
+            append(")\n")
+            append(chunk['document'])
+            append("\n```")
+        return "".join(parts)
+
+    def _query_vector_store(self, current_task: str) -> Optional[List[Dict[str, Any]]]:
+        """Blocking RAG lookup; returns None when there is no vector database or it is empty."""
+        if not self.vector_context_service or self.vector_context_service.collection.count() == 0:
+            return None
+        return self.vector_context_service.query(current_task, n_results=5)
+
+    async def _fetch_rag_context(self, current_task: str) -> str:
+        relevant_context = "No relevant code snippets were retrieved."
+        try:
+            retrieved_chunks = await asyncio.to_thread(self._query_vector_store, current_task)
+            if retrieved_chunks:
+                relevant_context = self._build_snippet_context(retrieved_chunks)
+        except Exception as e:
+            self.log("error", f"Failed to query vector context: {e}")
+        return relevant_context
+
     async def run_coding_task(self, task: Dict[str, Any], last_error: Optional[str] = None) -> Optional[Dict]:
         """Execute a coding task and return the tool call."""
         task_description = task.get('description', 'Unknown task')
         self.log("info", f"Executing coding task: '{task_description[:60]}...'")
 
-        prompt_template = CoderPrompt()
-        current_mission = self.mission_log_service.get_log_as_string_summary()
-        current_files = self.project_manager.get_project_files()
-
-        prompt = prompt_template.render(
-            task_description=task_description,
-            current_mission=current_mission,
-            current_files=current_files,
-            last_error=last_error
-        )
-
+        # Check the model first so an unconfigured coder never pays for reading the project
         provider, model = self.llm_client.get_model_for_role("coder")
         if not provider or not model:
             self.handle_error("Coder", "No 'coder' model configured.")
             return None
 
+        current_task = task_description
+        if last_error:
+            current_task += f"\n\nThe previous attempt failed with this error, so take a different approach:\n{last_error}"
+        available_tools = self.foundry_manager.get_llm_tool_definitions_json()
+        # The vector query and the file walk are independent, so overlap them
+        relevant_code_snippets, file_structure = await asyncio.gather(
+            self._fetch_rag_context(current_task),
+            asyncio.to_thread(self.project_manager.get_file_structure)
+        )
+
+        prompt = self._coder_prompt.render(
+            current_task=current_task,
+            mission_log=self.mission_log_service.get_log_as_string_summary(),
+            available_tools=available_tools,
+            file_structure=file_structure or "The project is currently empty.",
+            relevant_code_snippets=relevant_code_snippets
+        )
+
         try:
-            response_str = "".join(
-                [chunk async for chunk in self.llm_client.stream_chat(provider, model, prompt, "coder")])
+            # A retry after an error wants a fresh attempt, not the answer that just failed
+            response_str = await self._cached_collect("coder", provider, model, prompt,
+                                                      bypass_cache=last_error is not None)
 
-            match = re.search(r'\{.*\}', response_str, re.DOTALL)
-            if match:
-                tool_call = json.loads(match.group(0))
+            json_text = extract_first_json_object(response_str)
+            if json_text:
+                tool_call = json_utils.loads(json_text)
                 self.log("info", f"Generated tool call: {tool_call.get('tool_name', 'Unknown')}")
                 return tool_call
             else:
@@ -355,9 +528,9 @@ class DevelopmentTeamService:
         """Run the Sentry AI to check for issues and generate tests."""
         self.log("info", f"Running sentry check on: {file_path}")
 
-        prompt = SENTRY_PROMPT.format(
+        prompt = SENTRY_PROMPT.render(
             file_path=file_path,
-            file_contents=file_contents
+            code_content=file_contents
         )
 
         provider, model = self.llm_client.get_model_for_role("sentry")
@@ -366,12 +539,11 @@ class DevelopmentTeamService:
             return None
 
         try:
-            response_str = "".join(
-                [chunk async for chunk in self.llm_client.stream_chat(provider, model, prompt, "sentry")])
+            response_str = await self._cached_collect("sentry", provider, model, prompt)
 
-            match = re.search(r'\{.*\}', response_str, re.DOTALL)
-            if match:
-                result = json.loads(match.group(0))
+            json_text = extract_first_json_object(response_str)
+            if json_text:
+                result = json_utils.loads(json_text)
                 self.log("info", f"Sentry check completed: {result.get('issues_found', 0)} issues found")
                 return result
             else:
@@ -393,7 +565,7 @@ class DevelopmentTeamService:
         """Re-plan the mission when stuck."""
         self.log("info", "Running strategic re-planning...")
 
-        prompt_template = RePlannerPrompt()
+        prompt_template = self._replanner_prompt
         prompt = prompt_template.render(
             original_goal=original_goal,
             current_mission_state=current_mission
@@ -405,12 +577,12 @@ class DevelopmentTeamService:
             return []
 
         try:
-            response_str = "".join(
-                [chunk async for chunk in self.llm_client.stream_chat(provider, model, prompt, "planner")])
+            # Re-planning follows a failure, so replaying the previous plan would repeat it
+            response_str = await self._cached_collect("planner", provider, model, prompt, bypass_cache=True)
 
-            match = re.search(r'\{.*\}', response_str, re.DOTALL)
-            if match:
-                result = json.loads(match.group(0))
+            json_text = extract_first_json_object(response_str)
+            if json_text:
+                result = json_utils.loads(json_text)
                 new_plan = result.get("plan", [])
                 self.log("info", f"Re-planning generated {len(new_plan)} new tasks")
                 return new_plan
@@ -426,9 +598,9 @@ class DevelopmentTeamService:
         """Generate a summary of the completed mission."""
         self.log("info", "Generating mission summary...")
 
-        prompt_template = MissionSummarizerPrompt()
+        prompt_template = self._summarizer_prompt
         mission_log = self.mission_log_service.get_log_as_string_summary()
-        project_files = "\n".join(self.project_manager.get_project_files().keys())
+        project_files = self.project_manager.get_file_structure()
 
         prompt = prompt_template.render(
             mission_log=mission_log,
@@ -443,8 +615,7 @@ class DevelopmentTeamService:
             return "Mission completed successfully."
 
         try:
-            response_str = "".join(
-                [chunk async for chunk in self.llm_client.stream_chat(provider, model, prompt, "summarizer")])
+            response_str = await self._cached_collect("summarizer", provider, model, prompt, json_only=False)
 
             return response_str.strip() or "Mission completed successfully."
 
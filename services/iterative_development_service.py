@@ -10,12 +10,24 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from core import json_utils
 from event_bus import EventBus
 from core.models.messages import AuraMessage, MessageType
+from core.streaming_json import collect_json_text, extract_first_json_object
 from services.vector_context_service import VectorContextService
 
 logger = logging.getLogger(__name__)
 
+_BACKTICK_CODE_RE = re.compile(r'`([^`]+)`')
+_CODE_REFERENCE_RE = re.compile(r'\b(def\s+\w+|class\s+\w+|\w+\(\))')
+# Tried in order; the first pattern with a match names the error.
+_ERROR_LINE_PATTERNS = (
+    re.compile(r'(\w*Error: [^\n]+)'),
+    re.compile(r'(Traceback[^\n]+)'),
+    re.compile(r'(\w+Exception: [^\n]+)'),
+)
+_PREFERENCE_RE = re.compile(r'prefer (\w+)')
+
 
 @dataclass
 class CodeFeedback:
@@ -261,14 +273,13 @@ Example:
 {{"tool_name": "stream_and_write_file", "arguments": {{"path": "specific_file.py", "content": "improved code here"}}}}
 """
 
-            response_str = "".join(
-                [chunk async for chunk in self.llm_client.stream_chat(provider, model, full_prompt, "coder")])
+            response_str = await collect_json_text(
+                self.llm_client.stream_chat(provider, model, full_prompt, "coder"))
 
             # Parse JSON response
-            import json
-            match = re.search(r'\{.*\}', response_str, re.DOTALL)
-            if match:
-                tool_call = json.loads(match.group(0))
+            json_text = extract_first_json_object(response_str)
+            if json_text:
+                tool_call = json_utils.loads(json_text)
 
                 # Track the iteration
                 self.iteration_context.iteration_history.append({
@@ -341,12 +352,12 @@ Example:
     def _extract_correction_context(self, user_input: str) -> str:
         """Extract what the user wants corrected."""
         # Look for specific mentions of code elements
-        code_patterns = re.findall(r'`([^`]+)`', user_input)
+        code_patterns = _BACKTICK_CODE_RE.findall(user_input)
         if code_patterns:
             return f"Code elements mentioned: {', '.join(code_patterns)}"
 
         # Look for function/class references
-        func_patterns = re.findall(r'\b(def\s+\w+|class\s+\w+|\w+\(\))', user_input)
+        func_patterns = _CODE_REFERENCE_RE.findall(user_input)
         if func_patterns:
             return f"Functions/classes mentioned: {', '.join(func_patterns)}"
 
@@ -355,16 +366,10 @@ Example:
     def _extract_error_info(self, user_input: str) -> str:
         """Extract error information from user input."""
         # Look for common error patterns
-        error_patterns = [
-            r'(\w*Error: [^\n]+)',
-            r'(Traceback[^\n]+)',
-            r'(\w+Exception: [^\n]+)'
-        ]
-
-        for pattern in error_patterns:
-            matches = re.findall(pattern, user_input)
-            if matches:
-                return matches[0]
+        for pattern in _ERROR_LINE_PATTERNS:
+            match = pattern.search(user_input)
+            if match:
+                return match.group(1)
 
         return user_input[:200]
 
@@ -447,7 +452,7 @@ Example:
             self.user_coding_patterns['error_handling_important'] = True
         elif 'prefer' in comment_lower:
             # Extract specific preferences
-            preference_match = re.search(r'prefer (\w+)', comment_lower)
+            preference_match = _PREFERENCE_RE.search(comment_lower)
             if preference_match:
                 self.user_coding_patterns['general_preference'] = preference_match.group(1)
 
@@ -456,11 +461,7 @@ Example:
         if not self.user_coding_patterns:
             return "No specific preferences learned yet."
 
-        formatted = []
-        for key, value in self.user_coding_patterns.items():
-            formatted.append(f"- {key}: {value}")
-
-        return "\n".join(formatted)
+        return "\n".join(f"- {key}: {value}" for key, value in self.user_coding_patterns.items())
 
     def _get_current_working_files(self) -> List[str]:
         """Get files currently being worked on."""
@@ -1,9 +1,9 @@
 # services/mission_log_service.py
 import logging
-import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, TYPE_CHECKING
 
+from core import json_utils
 from event_bus import EventBus
 from events import MissionLogUpdated, ProjectCreated
 
@@ -25,19 +25,26 @@ class MissionLogService:
         self.tasks: List[Dict[str, Any]] = []
         self._next_task_id = 1
         self._initial_user_goal = ""
+        self._log_path_cache: Optional[Tuple[Path, Path]] = None
         self.event_bus.subscribe("project_created", self.handle_project_created)
         logger.info("MissionLogService initialized.")
 
     def handle_project_created(self, event: ProjectCreated):
         """Resets and loads the log when a new project becomes active."""
-        logger.info(f"ProjectCreated event received. Resetting and loading mission log for '{event.project_name}'.")
+        logger.info("ProjectCreated event received. Resetting and loading mission log for '%s'.", event.project_name)
         self.load_log_for_active_project()
 
     def _get_log_path(self) -> Optional[Path]:
-        """Gets the path to the mission log file for the active project."""
-        if self.project_manager.active_project_path:
-            return self.project_manager.active_project_path / MISSION_LOG_FILENAME
-        return None
+        """Gets the path to the mission log file for the active project, reusing it until the project changes."""
+        project_path = self.project_manager.active_project_path
+        if not project_path:
+            return None
+        cached = self._log_path_cache
+        if cached is not None and cached[0] == project_path:
+            return cached[1]
+        log_path = project_path / MISSION_LOG_FILENAME
+        self._log_path_cache = (project_path, log_path)
+        return log_path
 
     def _save_and_notify(self):
         """Saves the current list of tasks to disk and notifies the UI."""
@@ -48,20 +55,21 @@ class MissionLogService:
 
         # Always emit the event first to update UI immediately
         self.event_bus.emit("mission_log_updated", MissionLogUpdated(tasks=self.get_tasks()))
-        logger.debug(f"UI notified of mission log update. Task count: {len(self.tasks)}")
+        logger.debug("UI notified of mission log update. Task count: %d", len(self.tasks))
 
         log_path = self._get_log_path()
         if not log_path:
             logger.warning("No active project path - mission log not saved to disk.")
             return
 
-        log_path.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(log_path, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=2)
-            logger.debug(f"Mission Log saved to disk at {log_path}.")
+            # Saving is the only write, so the log's directory is created here rather than when resolving the path
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, 'wb') as f:
+                f.write(json_utils.dumps(data_to_save, indent=True))
+            logger.debug("Mission Log saved to disk at %s.", log_path)
         except IOError as e:
-            logger.error(f"Failed to save mission log to {log_path}: {e}")
+            logger.error("Failed to save mission log to %s: %s", log_path, e)
 
     def load_log_for_active_project(self):
         """Loads the mission log from disk for the currently active project."""
@@ -72,17 +80,17 @@ class MissionLogService:
 
         if log_path and log_path.exists():
             try:
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    saved_data = json.load(f)
+                with open(log_path, 'rb') as f:
+                    saved_data = json_utils.loads(f.read())
                     self.tasks = saved_data.get("tasks", [])
                     self._initial_user_goal = saved_data.get("initial_goal", "")
                 if self.tasks:
                     valid_ids = [task.get('id', 0) for task in self.tasks if task.get('id')]
                     self._next_task_id = max(valid_ids) + 1 if valid_ids else 1
-                logger.info(
-                    f"Successfully loaded Mission Log for '{self.project_manager.active_project_name}' with {len(self.tasks)} tasks.")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Failed to load or parse mission log at {log_path}: {e}. Starting fresh.")
+                logger.info("Successfully loaded Mission Log for '%s' with %d tasks.",
+                            self.project_manager.active_project_name, len(self.tasks))
+            except (json_utils.JSONDecodeError, IOError) as e:
+                logger.error("Failed to load or parse mission log at %s: %s. Starting fresh.", log_path, e)
                 self.tasks = []
         else:
             logger.info("No existing mission log found for this project. Starting fresh.")
@@ -104,11 +112,11 @@ class MissionLogService:
             self.add_task(description=step, notify=False)
 
         self._save_and_notify()
-        logger.info(f"Initial plan with {len(self.tasks)} steps has been set.")
+        logger.info("Initial plan with %d steps has been set.", len(self.tasks))
 
     def add_task(self, description: str, tool_call: Optional[Dict] = None, notify: bool = True) -> Dict[str, Any]:
         """Adds a new task to the mission log."""
-        if not description or not description.strip():
+        if not description or description.isspace():
             raise ValueError("Task description cannot be empty.")
 
         new_task = {
@@ -121,33 +129,54 @@ class MissionLogService:
 
         self.tasks.append(new_task)
         self._next_task_id += 1
-        logger.info(f"Added task {new_task['id']}: '{description.strip()}'")
+        logger.info("Added task %d: '%s'", new_task['id'], new_task['description'])
 
         if notify:
             self._save_and_notify()
 
         return new_task
 
+    def add_tasks(self, tasks: Iterable[Tuple[str, Optional[Dict]]]) -> List[Dict[str, Any]]:
+        """
+        Adds several (description, tool_call) tasks, then saves and notifies once.
+        The whole batch is validated first, so an invalid step adds nothing.
+        """
+        tasks = list(tasks)
+        for description, _ in tasks:
+            if not isinstance(description, str) or not description.strip():
+                raise ValueError(f"Task description must be a non-empty string, got {description!r}.")
+
+        new_tasks = []
+        try:
+            for description, tool_call in tasks:
+                new_tasks.append(self.add_task(description, tool_call, notify=False))
+        finally:
+            # Whatever made it into the log must reach disk and the UI
+            if new_tasks:
+                self._save_and_notify()
+        return new_tasks
+
     def mark_task_as_done(self, task_id: int) -> bool:
         """Marks a specific task as completed."""
         if not isinstance(task_id, int) or task_id <= 0:
-            logger.error(f"Invalid task_id: {task_id}. Must be a positive integer.")
+            logger.error("Invalid task_id: %s. Must be a positive integer.", task_id)
             return False
 
         for task in self.tasks:
             if task.get('id') == task_id:
                 if task.get('done'):
-                    logger.info(f"Task {task_id} was already marked as done.")
+                    logger.info("Task %d was already marked as done.", task_id)
                     return True
 
                 task['done'] = True
                 task['last_error'] = None
-                logger.info(f"Successfully marked task {task_id} as done: '{task.get('description', 'Unknown')}'")
+                logger.info("Successfully marked task %d as done: '%s'", task_id, task.get('description', 'Unknown'))
                 self._save_and_notify()
                 return True
 
-        logger.error(
-            f"Attempted to mark non-existent task {task_id} as done. Available task IDs: {[t.get('id') for t in self.tasks]}")
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Attempted to mark non-existent task %s as done. Available task IDs: %s",
+                         task_id, [t.get('id') for t in self.tasks])
         return False
 
     def get_tasks(self, done: Optional[bool] = None) -> List[Dict[str, Any]]:
@@ -156,6 +185,14 @@ class MissionLogService:
             return [task.copy() for task in self.tasks]
         return [task.copy() for task in self.tasks if task.get('done') == done]
 
+    def get_pending_tasks(self) -> Iterator[Dict[str, Any]]:
+        """Lazily yields copies of the tasks that are not yet done, in order."""
+        return (task.copy() for task in self.tasks if not task.get('done'))
+
+    def count_pending(self) -> int:
+        """Returns the number of tasks that are not yet done without copying them."""
+        return sum(1 for task in self.tasks if not task.get('done'))
+
     def get_task_by_id(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Returns a specific task by its ID."""
         for task in self.tasks:
@@ -169,9 +206,9 @@ class MissionLogService:
             if task.get('id') == task_id:
                 task['last_error'] = error_message
                 self._save_and_notify()
-                logger.info(f"Updated error for task {task_id}: {error_message}")
+                logger.info("Updated error for task %s: %s", task_id, error_message)
                 return True
-        logger.warning(f"Could not find task {task_id} to update error.")
+        logger.warning("Could not find task %s to update error.", task_id)
         return False
 
     def clear_all_tasks(self):
@@ -182,7 +219,7 @@ class MissionLogService:
             self._next_task_id = 1
             self._initial_user_goal = ""
             self._save_and_notify()
-            logger.info(f"Cleared {task_count} tasks from the Mission Log.")
+            logger.info("Cleared %d tasks from the Mission Log.", task_count)
 
     def replace_tasks_from_id(self, start_task_id: int, new_plan_steps: List[str]):
         """
@@ -196,7 +233,7 @@ class MissionLogService:
                 break
 
         if start_index == -1:
-            logger.error(f"Could not find task with ID {start_task_id} to start replacement.")
+            logger.error("Could not find task with ID %s to start replacement.", start_task_id)
             return
 
         # Remove the failed task and all subsequent tasks
@@ -208,8 +245,8 @@ class MissionLogService:
             self.add_task(description=step, notify=False)
 
         self._save_and_notify()
-        logger.info(
-            f"Replaced {removed_count} tasks from ID {start_task_id} with new plan of {len(new_plan_steps)} steps.")
+        logger.info("Replaced %d tasks from ID %s with new plan of %d steps.",
+                    removed_count, start_task_id, len(new_plan_steps))
 
     def get_initial_goal(self) -> str:
         """Returns the initial user goal that started the mission."""
@@ -217,25 +254,25 @@ class MissionLogService:
 
     def get_log_as_string_summary(self) -> str:
         """Returns a concise string summary of the mission log state."""
-        tasks = self.get_tasks()
-        if not tasks:
+        if not self.tasks:
             return "State: EMPTY. No tasks in the mission log."
 
-        pending = [t for t in tasks if not t['done']]
-        done = [t for t in tasks if t['done']]
+        pending_count = self.count_pending()
+        done_count = len(self.tasks) - pending_count
 
-        if pending:
-            next_task_desc = pending[0]['description'][:50] + ("..." if len(pending[0]['description']) > 50 else "")
-            return f"State: IN_PROGRESS. {len(done)} tasks done, {len(pending)} tasks pending. Next up: '{next_task_desc}'"
+        if pending_count:
+            next_task = next(self.get_pending_tasks())
+            next_task_desc = next_task['description'][:50] + ("..." if len(next_task['description']) > 50 else "")
+            return f"State: IN_PROGRESS. {done_count} tasks done, {pending_count} tasks pending. Next up: '{next_task_desc}'"
         else:
-            return f"State: COMPLETE. All {len(done)} tasks are done."
+            return f"State: COMPLETE. All {done_count} tasks are done."
 
     def get_task_statistics(self) -> Dict[str, int]:
         """Returns statistics about the current tasks."""
-        tasks = self.get_tasks()
+        pending_count = self.count_pending()
         return {
-            "total": len(tasks),
-            "completed": len([t for t in tasks if t.get('done')]),
-            "pending": len([t for t in tasks if not t.get('done')]),
-            "with_errors": len([t for t in tasks if t.get('last_error')])
+            "total": len(self.tasks),
+            "completed": len(self.tasks) - pending_count,
+            "pending": pending_count,
+            "with_errors": sum(1 for t in self.tasks if t.get('last_error'))
         }
\ No newline at end of file
@@ -3,10 +3,10 @@ import inspect
 import logging
 import asyncio
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 
 from event_bus import EventBus
-from foundry import FoundryManager, BlueprintInvocation
+from foundry import FoundryManager, Blueprint, BlueprintInvocation
 from core.managers.project_manager import ProjectManager
 from services.mission_log_service import MissionLogService
 from services.vector_context_service import VectorContextService
@@ -23,6 +23,10 @@ class ToolRunnerService:
     """
 
     PATH_PARAM_KEYS = {'path', 'file_path', 'target_path', 'source_path', 'output_path'}
+    INJECTED_PARAM_KEYS = frozenset({
+        'project_manager', 'mission_log_service', 'vector_context_service',
+        'llm_client', 'foundry_manager', 'event_bus', 'project_context'
+    })
 
     def __init__(
             self,
@@ -54,27 +58,34 @@ class ToolRunnerService:
             'event_bus': self.event_bus
         }
 
-    async def run_tool_by_dict(self, tool_call_dict: dict) -> Any:
+    def validate_tool_call(self, tool_call_dict: Any) -> Tuple[Optional[Blueprint], Optional[str]]:
         """
-        Executes a tool call from a dictionary specification.
-        Enhanced with better error handling and result validation.
+        Checks a tool call's shape and resolves its blueprint without executing anything.
+        Returns (blueprint, None) when valid, or (None, error_message) otherwise.
         """
         if not tool_call_dict or not isinstance(tool_call_dict, dict):
-            error_msg = "Error: Invalid tool call - must be a non-empty dictionary."
-            self.log("error", error_msg)
-            return error_msg
+            return None, "Error: Invalid tool call - must be a non-empty dictionary."
 
         tool_name = tool_call_dict.get("tool_name")
         if not tool_name:
-            error_msg = "Error: Tool call missing required 'tool_name' field."
-            self.log("error", error_msg)
-            return error_msg
+            return None, "Error: Tool call missing required 'tool_name' field."
 
         blueprint = self.foundry_manager.get_blueprint(tool_name)
         if not blueprint:
-            error_msg = f"Error: Blueprint '{tool_name}' not found in Foundry."
+            return None, f"Error: Blueprint '{tool_name}' not found in Foundry."
+
+        return blueprint, None
+
+    async def run_tool_by_dict(self, tool_call_dict: dict) -> Any:
+        """
+        Executes a tool call from a dictionary specification.
+        Enhanced with better error handling and result validation.
+        """
+        blueprint, error_msg = self.validate_tool_call(tool_call_dict)
+        if error_msg:
             self.log("error", error_msg)
             return error_msg
+        tool_name = tool_call_dict["tool_name"]
 
         arguments = tool_call_dict.get('arguments', {})
         if not isinstance(arguments, dict):
@@ -210,13 +221,14 @@ class ToolRunnerService:
                             resolved_path = (base_path / path_obj).resolve()
                             execution_params[key] = str(resolved_path)
 
-        # Inject services based on function signature
-        for param_name in sig.parameters:
-            if param_name in service_map:
-                if service_map[param_name] is not None:
-                    execution_params[param_name] = service_map[param_name]
-            elif param_name == 'project_context':
-                execution_params['project_context'] = self.project_manager.active_project_context
+        # Inject services based on function signature, merged in a single update
+        injections = {
+            name: service_map[name] for name in sig.parameters
+            if service_map.get(name) is not None
+        }
+        if 'project_context' in sig.parameters:
+            injections['project_context'] = self.project_manager.active_project_context
+        execution_params.update(injections)
 
         return execution_params
 
@@ -225,13 +237,11 @@ class ToolRunnerService:
         Creates a copy of parameters for display purposes, making paths relative.
         This version avoids deepcopying un-copyable service objects.
         """
-        display_params = {}
-        service_keys = list(self._get_service_map().keys()) + ['project_context']
-
         # Copy non-service parameters
-        for key, value in execution_params.items():
-            if key not in service_keys:
-                display_params[key] = value
+        display_params = {
+            key: value for key, value in execution_params.items()
+            if key not in self.INJECTED_PARAM_KEYS
+        }
 
         # Make absolute paths relative for display
         base_path = self.project_manager.active_project_path
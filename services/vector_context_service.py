@@ -8,6 +8,7 @@ import ast
 import json
 import hashlib
 import re
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Set, Optional, Tuple
@@ -24,6 +25,8 @@ logger = logging.getLogger(__name__)
 # Default model - will try CodeBERT at runtime
 DEFAULT_EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
 CODEBERT_MODEL = 'microsoft/codebert-base'
+# Smart-query results kept for repeated task descriptions; cleared whenever the index changes.
+QUERY_CACHE_MAX_ITEMS = 256
 
 
 class CodeElementType(Enum):
@@ -87,6 +90,9 @@ class VectorContextService:
             self.recently_modified = {}  # file_path -> timestamp
             self.temporal_cache_timeout = timedelta(hours=1)
 
+            # (query, intent, current_file, n_results) -> ranked results
+            self._query_cache: "OrderedDict[Tuple[str, str, Optional[str], int], List[Dict[str, Any]]]" = OrderedDict()
+
             logger.info(f"Vector database connected. Collection contains {self.collection.count()} documents.")
 
         except Exception as e:
@@ -120,10 +126,9 @@ class VectorContextService:
         logger.info(f"Generating embeddings for {len(documents)} new documents...")
 
         # Create enhanced embedding content
-        enhanced_documents = []
-        for i, doc in enumerate(documents):
-            enhanced_content = self._create_embedding_content(doc, metadatas[i])
-            enhanced_documents.append(enhanced_content)
+        enhanced_documents = [
+            self._create_embedding_content(doc, metadata) for doc, metadata in zip(documents, metadatas)
+        ]
 
         embeddings = self.embedding_model.encode(enhanced_documents, show_progress_bar=True)
 
@@ -139,6 +144,7 @@ class VectorContextService:
             metadatas=metadatas,
             ids=ids
         )
+        self._clear_query_caches()
         logger.info(f"Successfully added documents. Collection now has {self.collection.count()} items.")
 
     def index_project_comprehensive(self, project_root: Path, force_reindex: bool = False, batch_size: int = 100) -> Dict[str, int]:
@@ -212,7 +218,14 @@ class VectorContextService:
                     current_file: Optional[str] = None, n_results: int = 5) -> List[Dict[str, Any]]:
         """
         Intelligent query that understands coding intent and context.
+        Results are cached until the index or the recency data changes.
         """
+        cache_key = (query_text, intent, current_file, n_results)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            return list(cached)
+
         if self.collection.count() == 0:
             logger.warning("Query attempted on an empty collection.")
             return []
@@ -222,11 +235,14 @@ class VectorContextService:
         # Enhance query based on intent
         enhanced_query = self._enhance_query_for_intent(query_text, intent)
 
+        # Embed with the same model the documents were indexed with, not Chroma's default embedder
+        query_embedding = self.embedding_model.encode([enhanced_query])[0]
+
         # Get more results for reranking
         initial_results = min(50, n_results * 10)
 
         results = self.collection.query(
-            query_texts=[enhanced_query],
+            query_embeddings=[query_embedding.tolist()],
             n_results=initial_results,
             include=['documents', 'metadatas', 'distances']
         )
@@ -274,8 +290,19 @@ class VectorContextService:
         # Apply diversity (max 2 results per file)
         diversified = self._apply_diversity(structured_results, max_per_file=2)
 
-        logger.info(f"Returning {len(diversified[:n_results])} smart results")
-        return diversified[:n_results]
+        top_results = diversified[:n_results]
+        self._remember_query(cache_key, top_results)
+
+        logger.info(f"Returning {len(top_results)} smart results")
+        return list(top_results)
+
+    def _remember_query(self, cache_key: Tuple[str, str, Optional[str], int], results: List[Dict[str, Any]]):
+        self._query_cache[cache_key] = results
+        if len(self._query_cache) > QUERY_CACHE_MAX_ITEMS:
+            self._query_cache.popitem(last=False)
+
+    def _clear_query_caches(self):
+        self._query_cache.clear()
 
     def query(self, query_text: str, n_results: int = 5) -> List[Dict[str, Any]]:
         """
@@ -317,6 +344,7 @@ class VectorContextService:
         """Mark a file as recently modified for temporal scoring."""
         self.recently_modified[file_path] = datetime.now()
         self._cleanup_temporal_cache()
+        self._clear_query_caches()
 
     def _cleanup_temporal_cache(self):
         """Remove old entries from temporal cache."""
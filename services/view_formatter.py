@@ -28,4 +28,4 @@ def format_as_box(title: str, content: str) -> str:
     bottom_border = f"└{'─' * (max_len + 2)}┘"
 
     # Join all parts
-    return "\n".join([top_border] + content_lines + [bottom_border])
\ No newline at end of file
+    return "\n".join((top_border, *content_lines, bottom_border))
\ No newline at end of file